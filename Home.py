@@ -8,13 +8,16 @@ Last Updated: November 2025
 """
 
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
 import json
 import numpy as np
 
+from utils.constants import PLATFORM_RELEASE, PLATFORM_VERSION
+from utils.data import load_data, load_fema_data
+from utils.helpers import WARMING_TRENDS
+
 # Page configuration
 st.set_page_config(
     page_title="Washington State Wildfire Risk Intelligence Platform - Home",
@@ -84,23 +87,123 @@ st.markdown("""
     </style>
     """, unsafe_allow_html=True)
 
-# Load data
+# In-memory only: the key has no tie to the FEMA CSV, so a persist="disk" entry would
+# outlive a data refresh and serve a stale timeline after restarts
 @st.cache_data
-def load_data():
-    """Load the integrated dashboard dataset"""
-    df = pd.read_csv('data/WA_Climate_Fire_Dashboard_Data.csv')
-    return df
+def disaster_timeline():
+    """Annual FEMA declaration counts with a fitted linear trend"""
+    fema = load_fema_data()
+    yearly = fema['year'].value_counts().sort_index()
+    years = yearly.index.to_numpy()
+    counts = yearly.to_numpy()
+    trend = np.poly1d(np.polyfit(years, counts, 1))(years)
+    return years, counts, trend
+
+@st.cache_data
+def summary_tables():
+    """Top-10 risk counties and the risk/trend category counts"""
+    df = load_data()
+    top_counties = df.nlargest(10, 'climate_fire_risk_score')[
+        ['County', 'climate_fire_risk_score', 'risk_category', 'climate_trend', 'population_at_risk']
+    ]
+    # Trend classes without counties (e.g. Cooling) are left out of the trend chart
+    trend_counts = df['climate_trend'].cat.remove_unused_categories().value_counts()
+    return top_counties, df['risk_category'].value_counts(), trend_counts
 
 @st.cache_data
-def load_fema_data():
-    """Load FEMA disaster data"""
-    try:
-        fema = pd.read_csv('data/FEMA_Disasters_Geocoded.csv')
-        fema['declarationDate'] = pd.to_datetime(fema['declarationDate'])
-        return fema
-    except FileNotFoundError:
-        return None
+def risk_pie_spec():
+    """Serialized risk-category donut chart"""
+    risk_counts = summary_tables()[1]
 
+    # Define proper color mapping
+    color_map = {
+        'Critical': '#8B0000',
+        'High': '#d32f2f',
+        'Moderate': '#FFA500',
+        'Low': '#90EE90'
+    }
+    
+    # Create ordered list matching the color map
+    ordered_categories = ['Critical', 'High', 'Moderate', 'Low']
+    present = [cat for cat in ordered_categories if risk_counts.get(cat, 0) > 0]
+    colors = [color_map[cat] for cat in present]
+    labels = present
+    values = [risk_counts[cat] for cat in present]
+    
+    fig_risk = go.Figure(data=[go.Pie(
+        labels=labels,
+        values=values,
+        marker=dict(colors=colors),
+        hole=0.4,
+        textfont=dict(size=14, color='white')
+    )])
+    
+    fig_risk.update_layout(
+        showlegend=True,
+        height=250,
+        margin=dict(l=20, r=20, t=30, b=20),
+        annotations=[dict(text='Counties', x=0.5, y=0.5, font_size=14, showarrow=False)]
+    )
+    return fig_risk.to_dict()
+
+@st.cache_data
+def trend_bar_spec():
+    """Serialized climate-trend bar chart"""
+    trend_counts = summary_tables()[2]
+
+    fig_trend = go.Figure(data=[go.Bar(
+        x=trend_counts.values,
+        y=trend_counts.index,
+        orientation='h',
+        marker=dict(color=['#d32f2f' if t == 'Warming & Drying' else '#f57c00' if t == 'Warming' else '#1976d2' if t == 'Cooling' else '#7cb342' for t in trend_counts.index])
+    )])
+    
+    fig_trend.update_layout(
+        showlegend=False,
+        height=200,
+        margin=dict(l=20, r=20, t=20, b=20),
+        xaxis_title="Counties",
+        yaxis_title=""
+    )
+    return fig_trend.to_dict()
+
+@st.cache_data
+def timeline_spec():
+    """Serialized FEMA declaration timeline with its trend line"""
+    years, counts, trend = disaster_timeline()
+    
+    fig_timeline = go.Figure()
+    
+    fig_timeline.add_trace(go.Scatter(
+        x=years,
+        y=counts,
+        mode='lines+markers',
+        name='Annual Disasters',
+        line=dict(color='#d32f2f', width=3),
+        marker=dict(size=8),
+        fill='tozeroy',
+        fillcolor='rgba(211, 47, 47, 0.1)'
+    ))
+    
+    # Add trend line
+    fig_timeline.add_trace(go.Scatter(
+        x=years,
+        y=trend,
+        mode='lines',
+        name='Trend',
+        line=dict(color='#1976d2', width=2, dash='dash')
+    ))
+    
+    fig_timeline.update_layout(
+        title="Federal Fire Disaster Declarations Over Time",
+        xaxis_title="Year",
+        yaxis_title="Number of Declarations",
+        hovermode='x unified',
+        height=400
+    )
+    return fig_timeline.to_dict()
+
+# Load data
 try:
     df = load_data()
     fema_data = load_fema_data()
@@ -108,6 +211,9 @@ except FileNotFoundError:
     st.error("⚠️ Data files not found. Please ensure data/ folder contains required files.")
     st.stop()
 
+# Top counties and risk category counts for the summary metrics (the trend counts feed the trend chart)
+top_counties, risk_counts, _ = summary_tables()
+
 # Header with branding
 col1, col2 = st.columns([3, 1])
 with col1:
@@ -132,8 +238,8 @@ st.markdown("### Executive Summary")
 col1, col2, col3, col4, col5 = st.columns(5)
 
 with col1:
-    critical_count = len(df[df['risk_category'] == 'Critical'])
-    high_count = len(df[df['risk_category'] == 'High'])
+    critical_count = risk_counts.get('Critical', 0)
+    high_count = risk_counts.get('High', 0)
     st.metric(
         "Critical Risk",
         f"{critical_count}",
@@ -161,7 +267,7 @@ with col3:
     )
 
 with col4:
-    warming_counties = len(df[df['climate_trend'].str.contains('Warming', na=False)])
+    warming_counties = int(df['climate_trend'].isin(WARMING_TRENDS).sum())
     st.metric(
         "Climate Concern",
         f"{warming_counties}",
@@ -189,66 +295,22 @@ col1, col2 = st.columns([2, 1])
 with col1:
     # Top risk counties
     st.markdown("#### Highest Risk Counties")
-    top_counties = df.nlargest(10, 'climate_fire_risk_score')[['County', 'climate_fire_risk_score', 'risk_category', 'climate_trend', 'population_at_risk']]
-    top_counties['population_at_risk'] = top_counties['population_at_risk'].apply(lambda x: f"{x:,.0f}")
     top_counties.columns = ['County', 'Risk Score', 'Category', 'Climate Trend', 'Pop. at Risk']
+    # Format at render time via the Styler instead of a per-row lambda
+    styled_counties = top_counties.style.format({'Risk Score': '{:.1f}', 'Pop. at Risk': '{:,.0f}'})
     
-    st.dataframe(top_counties, width='stretch', hide_index=True, height=400)
+    st.dataframe(styled_counties, width='stretch', hide_index=True, height=400)
 
 with col2:
     # Risk distribution
     st.markdown("#### Risk Distribution")
-    risk_counts = df['risk_category'].value_counts()
-    
-    # Define proper color mapping
-    color_map = {
-        'Critical': '#8B0000',
-        'High': '#d32f2f',
-        'Moderate': '#FFA500',
-        'Low': '#90EE90'
-    }
-    
-    # Create ordered list matching the color map
-    ordered_categories = ['Critical', 'High', 'Moderate', 'Low']
-    colors = [color_map[cat] for cat in ordered_categories if cat in risk_counts.index]
-    labels = [cat for cat in ordered_categories if cat in risk_counts.index]
-    values = [risk_counts[cat] for cat in ordered_categories if cat in risk_counts.index]
-    
-    fig_risk = go.Figure(data=[go.Pie(
-        labels=labels,
-        values=values,
-        marker=dict(colors=colors),
-        hole=0.4,
-        textfont=dict(size=14, color='white')
-    )])
     
-    fig_risk.update_layout(
-        showlegend=True,
-        height=250,
-        margin=dict(l=20, r=20, t=30, b=20),
-        annotations=[dict(text='Counties', x=0.5, y=0.5, font_size=14, showarrow=False)]
-    )
-    st.plotly_chart(fig_risk, width='stretch')
+    st.plotly_chart(risk_pie_spec(), width='stretch')
     
     # Climate trends
     st.markdown("#### Climate Trends")
-    trend_counts = df['climate_trend'].value_counts()
-    
-    fig_trend = go.Figure(data=[go.Bar(
-        x=trend_counts.values,
-        y=trend_counts.index,
-        orientation='h',
-        marker=dict(color=['#d32f2f' if t == 'Warming & Drying' else '#f57c00' if t == 'Warming' else '#1976d2' if t == 'Cooling' else '#7cb342' for t in trend_counts.index])
-    )])
     
-    fig_trend.update_layout(
-        showlegend=False,
-        height=200,
-        margin=dict(l=20, r=20, t=20, b=20),
-        xaxis_title="Counties",
-        yaxis_title=""
-    )
-    st.plotly_chart(fig_trend, width='stretch')
+    st.plotly_chart(trend_bar_spec(), width='stretch')
 
 st.markdown("---")
 
@@ -257,42 +319,7 @@ st.markdown("### Historical Disaster Trends")
 
 if fema_data is not None:
     # Disasters by year
-    fema_data['year'] = fema_data['declarationDate'].dt.year
-    yearly_disasters = fema_data.groupby('year').size().reset_index(name='count')
-    
-    fig_timeline = go.Figure()
-    
-    fig_timeline.add_trace(go.Scatter(
-        x=yearly_disasters['year'],
-        y=yearly_disasters['count'],
-        mode='lines+markers',
-        name='Annual Disasters',
-        line=dict(color='#d32f2f', width=3),
-        marker=dict(size=8),
-        fill='tozeroy',
-        fillcolor='rgba(211, 47, 47, 0.1)'
-    ))
-    
-    # Add trend line
-    z = np.polyfit(yearly_disasters['year'], yearly_disasters['count'], 1)
-    p = np.poly1d(z)
-    fig_timeline.add_trace(go.Scatter(
-        x=yearly_disasters['year'],
-        y=p(yearly_disasters['year']),
-        mode='lines',
-        name='Trend',
-        line=dict(color='#1976d2', width=2, dash='dash')
-    ))
-    
-    fig_timeline.update_layout(
-        title="Federal Fire Disaster Declarations Over Time",
-        xaxis_title="Year",
-        yaxis_title="Number of Declarations",
-        hovermode='x unified',
-        height=400
-    )
-    
-    st.plotly_chart(fig_timeline, width='stretch')
+    st.plotly_chart(timeline_spec(), width='stretch')
     
     # Recent disaster highlights
     col1, col2, col3 = st.columns(3)
@@ -420,10 +447,10 @@ with st.sidebar:
 
 # Footer
 st.markdown("---")
-st.markdown("""
+st.markdown(f"""
     <div style='text-align: center; color: #666; font-size: 0.85rem;'>
         <b>Washington State Wildfire Risk Intelligence Platform</b> (WA FireWatch)<br>
         Data Sources: NOAA Climate Normals | FEMA Declarations | USDA Forest Service WUI | U.S. Census Bureau<br>
-        Last Updated: November 2025 | Version 2.0
+        Last Updated: {PLATFORM_RELEASE} | Version {PLATFORM_VERSION}
     </div>
 """, unsafe_allow_html=True)
@@ -7,8 +7,11 @@ import streamlit as st
 import pandas as pd
 import folium
 from folium import plugins
-from streamlit_folium import st_folium
-import json
+import streamlit.components.v1 as components
+import numpy as np
+
+from utils.data import load_data, load_fema_data, load_geojson
+from utils.helpers import format_dates_for_display
 
 st.set_page_config(
     page_title="Washington State Wildfire Risk Intelligence Platform - Interactive Map",
@@ -16,34 +19,396 @@ st.set_page_config(
     layout="wide"
 )
 
-# Load data
-@st.cache_data
-def load_data():
-    df = pd.read_csv('data/WA_Climate_Fire_Dashboard_Data.csv')
-    return df
-
-@st.cache_data
-def load_fema_data():
-    try:
-        fema = pd.read_csv('data/FEMA_Disasters_Geocoded.csv')
-        fema['declarationDate'] = pd.to_datetime(fema['declarationDate'])
-        return fema
-    except FileNotFoundError:
-        return None
-
-@st.cache_data
-def load_geojson():
-    """Load Washington counties GeoJSON"""
-    try:
-        with open('data/wa_counties.geojson', 'r') as f:
-            geojson = json.load(f)
-        return geojson
-    except FileNotFoundError:
-        return None
+# Folium marker styling by risk category (anything else renders as Low)
+MARKER_COLORS = {
+    'Critical': 'darkred',
+    'High': 'red',
+    'Moderate': 'orange'
+}
+
+MARKER_ICONS = {
+    'Critical': 'fire',
+    'High': 'warning-sign',
+    'Moderate': 'exclamation-sign'
+}
+
+# Base map tile options
+TILE_OPTIONS = {
+    "OpenStreetMap": "OpenStreetMap",
+    "Satellite": "https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}",
+    "Terrain": "https://server.arcgisonline.com/ArcGIS/rest/services/World_Terrain_Base/MapServer/tile/{z}/{y}/{x}",
+    "Dark": "CartoDB dark_matter"
+}
+
+# County marker popup, filled per county with str.format
+COUNTY_POPUP_TEMPLATE = """
+<div style="font-family: Arial, sans-serif; width: 350px; max-height: 400px; overflow-y: auto;">
+    <div style="background: linear-gradient(135deg, {color} 0%, {color}dd 100%); 
+                color: white; padding: 15px; margin: -10px -10px 10px -10px; border-radius: 5px 5px 0 0;">
+        <h3 style="margin: 0; font-size: 1.3rem;">{county} County</h3>
+        <div style="font-size: 0.9rem; margin-top: 5px;">Risk Score: {risk_score:.1f} | {risk_category}</div>
+    </div>
+
+    <div style="padding: 5px; color: #333;">
+        <h4 style="color: #1976d2; margin: 10px 0 5px 0; border-bottom: 2px solid #1976d2;">
+            Risk Assessment
+        </h4>
+        <table style="width: 100%; font-size: 0.9rem;">
+            <tr><td><b>Climate Trend:</b></td><td>{climate_trend}</td></tr>
+            <tr><td><b>Heat Stress:</b></td><td>{heat_stress:.1f}</td></tr>
+            <tr><td><b>Drought Stress:</b></td><td>{drought_stress:.1f}</td></tr>
+            <tr><td><b>Fire History Score:</b></td><td>{fire_history_score:.1f}</td></tr>
+            <tr><td><b>WUI Exposure:</b></td><td>{wui_exposure_pct:.1f}%</td></tr>
+        </table>
+
+        <h4 style="color: #d32f2f; margin: 15px 0 5px 0; border-bottom: 2px solid #d32f2f;">
+            Federal Disasters: {fema_count}
+        </h4>
+        <table style="width: 100%; font-size: 0.9rem;">
+            <tr><td><b>Population:</b></td><td>{population:,}</td></tr>
+            <tr><td><b>At Risk (WUI):</b></td><td>{population_at_risk:,.0f}</td></tr>
+            <tr><td><b>% Interface:</b></td><td>{interface_pct:.1f}%</td></tr>
+            <tr><td><b>% Intermix:</b></td><td>{intermix_pct:.1f}%</td></tr>
+        </table>
+
+        <h4 style="color: #f57c00; margin: 15px 0 5px 0; border-bottom: 2px solid #f57c00;">
+            Recent Major Fires
+        </h4>
+        <div style="font-size: 0.9rem;">
+            <b>NOAA Fire Events:</b> {fire_count}<br>
+            <br>
+            {fires_list}
+        </div>
+    </div>
+</div>
+"""
+
+# FEMA marker popup, one per map grid cell of declarations
+FEMA_POPUP_TEMPLATE = """
+<div style="font-family: Arial; width: 280px; max-height: 300px; overflow-y: auto;">
+    <div style="background: #c62828; color: white; padding: 10px; margin: -10px -10px 10px -10px;">
+        <h4 style="margin: 0; color: white;">FEMA Disasters: {count}</h4>
+    </div>
+    <b>County:</b> {county}<br>
+    <hr style="margin: 8px 0;">
+    {disaster_list}
+    <hr style="margin: 8px 0;">
+    <small><i>Federal assistance declarations</i></small>
+</div>
+"""
+
+# Browser-side builder for clustered FEMA markers; rows are [lat, lon, radius, popup, tooltip]
+FEMA_MARKER_CALLBACK = """
+function (row) {
+    var marker = L.circleMarker(new L.LatLng(row[0], row[1]), {
+        radius: row[2],
+        color: '#c62828',
+        fill: true,
+        fillColor: '#ff5252',
+        fillOpacity: 0.7,
+        weight: 2
+    });
+    marker.bindPopup(row[3], {maxWidth: 300});
+    marker.bindTooltip(row[4]);
+    return marker;
+}
+"""
+
+# Cached derived views
+@st.cache_data(show_spinner=False, max_entries=32)
+def apply_filters(risk_tuple, trend_tuple, min_score, max_score, min_pop):
+    """Return the county rows matching the sidebar filter state"""
+    df = load_data()
+    scores = df['climate_fire_risk_score']
+    
+    # Default view: every category/trend selected and sliders at their extremes
+    all_risks = not risk_tuple or set(df['risk_category'].unique()) <= set(risk_tuple)
+    all_trends = not trend_tuple or set(df['climate_trend'].unique()) <= set(trend_tuple)
+    if (all_risks and all_trends and min_score <= scores.min() and max_score >= scores.max()
+            and min_pop <= df['population'].min()):
+        return df
+    
+    # Single query expression (evaluated by numexpr when it is installed); like the
+    # default view above, the rows keep their load_data index labels
+    conditions = ['@min_score <= climate_fire_risk_score <= @max_score', 'population >= @min_pop']
+    if risk_tuple:
+        conditions.append('risk_category in @risk_tuple')
+    if trend_tuple:
+        conditions.append('climate_trend in @trend_tuple')
+    return df.query(' and '.join(conditions))
+
+@st.cache_data(show_spinner=False)
+def fema_by_county():
+    """Map each county to its FEMA declaration count and three most recent fires"""
+    fema = load_fema_data()
+    if fema is None:
+        return {}
+    counts = fema['County'].value_counts()
+    # One global sort, then the newest three rows of every county in a single pass
+    recent = (
+        fema.sort_values('declarationDate', ascending=False)
+        .groupby('County', sort=False)
+        .head(3)
+    )
+    recent_by_county = {}
+    for county, title, date in recent[['County', 'declarationTitle', 'declarationDate']].itertuples(index=False, name=None):
+        recent_by_county.setdefault(county, []).append((title, date))
+    return {county: (count, recent_by_county[county]) for county, count in counts.items()}
+
+@st.cache_data(show_spinner=False)
+def fema_year_index():
+    """FEMA declarations sorted by date, with each year's [start, end) row bounds"""
+    fema = load_fema_data()
+    if fema is None:
+        return None, {}
+    fema = fema.sort_values('declarationDate').reset_index(drop=True)
+    years = fema['year'].to_numpy()
+    year_bounds = {
+        year: tuple(int(b) for b in np.searchsorted(years, [year, year + 1]))
+        for year in range(years.min(), years.max() + 1)
+    }
+    return fema, year_bounds
+
+def fema_in_year_range(fema_sorted, year_bounds, year_range):
+    """Slice the date-sorted FEMA frame to an inclusive year range"""
+    start_year, end_year = year_range
+    return fema_sorted.iloc[year_bounds[start_year][0]:year_bounds[end_year][1]]
+
+@st.cache_data(show_spinner=False)
+def county_centroids():
+    """Map county FIPS (GeoJSON GEOID) to its interior point coordinates"""
+    geojson = load_geojson()
+    if geojson is None:
+        return {}
+    return {
+        feature['properties']['GEOID']: (
+            float(feature['properties'].get('INTPTLAT', 47.5)),
+            float(feature['properties'].get('INTPTLON', -120.5))
+        )
+        for feature in geojson['features']
+    }
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_map_html(filter_key, overlay_key):
+    """Build the Folium map for a filter/overlay state and return its rendered HTML"""
+    base_layer, show_county_labels, show_heatmap, fema_year_range, cluster_markers, show_legend = overlay_key
+    filtered_df = apply_filters(*filter_key)
+    fema_data, fema_year_bounds = fema_year_index()
+    geojson_data = load_geojson()
+
+    m = folium.Map(
+        location=[47.5, -120.5],
+        zoom_start=7,
+        tiles=TILE_OPTIONS.get(base_layer, "OpenStreetMap"),
+        attr='WA FireWatch'
+    )
+
+    # Add choropleth layer for county boundaries
+    if geojson_data is not None:
+        folium.Choropleth(
+            geo_data=geojson_data,
+            name='County Risk Levels',
+            data=filtered_df,
+            columns=['county_fips', 'climate_fire_risk_score'],
+            key_on='feature.properties.GEOID',
+            fill_color='YlOrRd',
+            fill_opacity=0.6,
+            line_opacity=0.8,
+            line_weight=2,
+            line_color='white',
+            legend_name='Climate-Fire Risk Score',
+            nan_fill_color='lightgray',
+            nan_fill_opacity=0.2
+        ).add_to(m)
+
+    # Add risk intensity heatmap weighted by score at county centroids
+    if show_heatmap and len(filtered_df) > 0:
+        centroids = county_centroids()
+        heat_points = [
+            [*centroids[fips], score / 100]
+            for fips, score in zip(
+                filtered_df['county_fips'].astype(int).astype(str),
+                filtered_df['climate_fire_risk_score']
+            )
+            if fips in centroids
+        ]
+        plugins.HeatMap(heat_points, name='Risk Heatmap', radius=35).add_to(m)
+
+    # Add county markers with detailed popups using GeoJSON centroids
+    # Note: County markers are NOT clustered so all are always visible
+    if geojson_data is not None:
+        fema_lookup = fema_by_county()
+        centroids = county_centroids()
+        marker_cols = [
+            'County', 'county_fips', 'risk_category', 'climate_fire_risk_score', 'climate_trend',
+            'heat_stress', 'drought_stress', 'fire_history_score', 'wui_exposure_pct',
+            'population', 'population_at_risk', 'interface_pct', 'intermix_pct', 'Fire_Count'
+        ]
+        # Marker color and icon based on risk, mapped for the whole frame at once
+        marker_colors = filtered_df['risk_category'].map(MARKER_COLORS).fillna('green').to_numpy()
+        marker_icons = filtered_df['risk_category'].map(MARKER_ICONS).fillna('ok-sign').to_numpy()
+        # Iterate plain ndarray values rather than boxing each row into a Series
+        marker_rows = zip(*(filtered_df[col].to_numpy() for col in marker_cols), marker_colors, marker_icons)
+        for (county, county_fips, risk_category, risk_score, climate_trend,
+             heat_stress, drought_stress, fire_history_score, wui_exposure_pct,
+             population, population_at_risk, interface_pct, intermix_pct, fire_count,
+             color, icon) in marker_rows:
+            # Look up the county's interior point from the precomputed centroids
+            centroid = centroids.get(str(int(county_fips)))
+            if centroid is None:
+                continue
+            lat, lon = centroid
+            
+            # Count FEMA disasters for this county
+            if fema_data is not None:
+                fema_count, recent_fires = fema_lookup.get(county, (0, []))
+                fires_list = '<br>'.join([
+                    f"• <b>{title}</b> ({date.strftime('%Y-%m-%d')})"
+                    for title, date in recent_fires
+                ])
+            else:
+                fema_count = 0
+                fires_list = "No data available"
+        
+            # Create detailed popup from the shared template
+            popup_html = COUNTY_POPUP_TEMPLATE.format(
+                county=county,
+                color=color,
+                risk_score=risk_score,
+                risk_category=risk_category,
+                climate_trend=climate_trend,
+                heat_stress=heat_stress,
+                drought_stress=drought_stress,
+                fire_history_score=fire_history_score,
+                wui_exposure_pct=wui_exposure_pct,
+                fema_count=fema_count,
+                population=population,
+                population_at_risk=population_at_risk,
+                interface_pct=interface_pct,
+                intermix_pct=intermix_pct,
+                fire_count=fire_count,
+                fires_list=fires_list
+            )
+        
+            # Add to map directly (not cluster) so all counties are always visible
+            folium.Marker(
+                location=[lat, lon],
+                popup=folium.Popup(popup_html, max_width=400),
+                tooltip=f"{county}: {risk_score:.1f}",
+                icon=folium.Icon(color=color, icon=icon, prefix='glyphicon')
+            ).add_to(m)  # Add to map directly, not marker_parent
+        
+            # Add county label if requested
+            if show_county_labels:
+                folium.Marker(
+                    location=[lat, lon],
+                    icon=folium.DivIcon(html=f"""
+                        <div style="font-size: 10px; font-weight: bold; color: #333; 
+                                    text-shadow: 1px 1px 2px white, -1px -1px 2px white;
+                                    white-space: nowrap;">
+                            {county}
+                        </div>
+                    """)
+                ).add_to(m)
+
+    # Add FEMA disaster markers
+    if fema_year_range is not None and fema_data is not None:
+        fema_filtered = fema_in_year_range(
+            fema_data, fema_year_bounds, fema_year_range
+        ).dropna(subset=['lat', 'lon'])
+    
+        # Collapse declarations sharing a ~0.05 degree grid cell into one sized marker
+        fema_cells = (
+            fema_filtered
+            .assign(
+                lat_bin=(fema_filtered['lat'] * 20).round(),
+                lon_bin=(fema_filtered['lon'] * 20).round(),
+                date_label=format_dates_for_display(fema_filtered['declarationDate'])
+            )
+            .sort_values('declarationDate', ascending=False)
+            .groupby(['lat_bin', 'lon_bin'], sort=False)
+            .agg(
+                lat=('lat', 'mean'),
+                lon=('lon', 'mean'),
+                county=('County', 'first'),
+                count=('disasterNumber', 'size'),
+                titles=('declarationTitle', list),
+                dates=('declarationDate', list),
+                date_labels=('date_label', list),
+                numbers=('disasterNumber', list)
+            )
+        )
+        
+        fema_markers = []
+        for lat, lon, county, count, titles, dates, date_labels, numbers in fema_cells.itertuples(index=False, name=None):
+            disaster_list = '<br>'.join([
+                f"<b>{title}</b> ({date_label}, #{number})"
+                for title, date_label, number in zip(titles, date_labels, numbers)
+            ])
+            popup_html = FEMA_POPUP_TEMPLATE.format(
+                count=count,
+                county=county,
+                disaster_list=disaster_list
+            )
+            tooltip = f"{county}: {count} FEMA disaster{'s' if count != 1 else ''} ({dates[-1].year}-{dates[0].year})"
+            fema_markers.append([lat, lon, 5 + 3 * count ** 0.5, popup_html, tooltip])
+        
+        if cluster_markers:
+            # Ship the rows as one JS array and build the markers in the browser
+            plugins.FastMarkerCluster(
+                fema_markers,
+                callback=FEMA_MARKER_CALLBACK,
+                name='FEMA Disasters',
+                overlay=True,
+                control=True
+            ).add_to(m)
+        else:
+            for lat, lon, radius, popup_html, tooltip in fema_markers:
+                folium.CircleMarker(
+                    location=[lat, lon],
+                    radius=radius,
+                    popup=folium.Popup(popup_html, max_width=300),
+                    tooltip=tooltip,
+                    color='#c62828',
+                    fill=True,
+                    fillColor='#ff5252',
+                    fillOpacity=0.7,
+                    weight=2
+                ).add_to(m)
+
+    # Add improved legend if requested
+    if show_legend:
+        legend_html = '''
+        <div style="position: fixed; 
+                    bottom: 60px; left: 10px; width: 180px; 
+                    background-color: rgba(255, 255, 255, 0.95); 
+                    border: 2px solid #333; 
+                    z-index:9999; 
+                    font-size:12px; 
+                    padding: 12px; 
+                    border-radius: 8px;
+                    box-shadow: 0 2px 10px rgba(0,0,0,0.3);">
+            <h4 style="margin: 0 0 8px 0; color: #333; font-size: 13px; border-bottom: 2px solid #333; padding-bottom: 4px;">Risk Categories</h4>
+            <p style="margin: 4px 0; color: #333;"><span style="color: #8B0000; font-size: 16px;">■</span> Critical (&gt;65)</p>
+            <p style="margin: 4px 0; color: #333;"><span style="color: #d32f2f; font-size: 16px;">■</span> High (55-65)</p>
+            <p style="margin: 4px 0; color: #333;"><span style="color: #FFA500; font-size: 16px;">■</span> Moderate (45-55)</p>
+            <p style="margin: 4px 0; color: #333;"><span style="color: #90EE90; font-size: 16px;">■</span> Low (&lt;45)</p>
+            <hr style="margin: 6px 0; border-color: #666;">
+            <p style="margin: 4px 0; color: #333;"><span style="color: #c62828; font-size: 14px;">●</span> FEMA Disaster</p>
+        </div>
+        '''
+        m.get_root().html.add_child(folium.Element(legend_html))
+
+    # Add layer control
+    folium.LayerControl(position='topright').add_to(m)
 
+    return m.get_root().render()
+
+# Load data
 df = load_data()
 fema_data = load_fema_data()
 geojson_data = load_geojson()
+fema_sorted, fema_year_bounds = fema_year_index()
 
 # Header
 st.title("🗺️ Interactive Wildfire Risk Map")
@@ -54,14 +419,6 @@ st.markdown("---")
 with st.sidebar:
     st.header(" Map Controls")
     
-    st.subheader("Base Layer")
-    base_layer = st.selectbox(
-        "Map Style",
-        ["OpenStreetMap", "Satellite", "Terrain", "Dark"],
-        help="Choose base map visualization"
-    )
-    
-    st.markdown("---")
     st.subheader("Risk Filters")
     
     # Risk category filter
@@ -101,278 +458,78 @@ with st.sidebar:
         help="Filter out low-population counties"
     )
     
-    st.markdown("---")
-    st.subheader("Data Overlays")
-    
-    show_fema = st.checkbox("FEMA Disasters", value=True, help="Show federal disaster declarations")
-    show_county_labels = st.checkbox("County Labels", value=False, help="Display county names on map")
-    show_heatmap = st.checkbox("Risk Heatmap", value=False, help="Show risk intensity heatmap")
-    
-    if show_fema and fema_data is not None:
-        st.markdown("**FEMA Filter**")
-        fema_year_range = st.slider(
-            "Year Range",
-            min_value=int(fema_data['declarationDate'].dt.year.min()),
-            max_value=int(fema_data['declarationDate'].dt.year.max()),
-            value=(2015, int(fema_data['declarationDate'].dt.year.max()))
-        )
-    
-    st.markdown("---")
-    st.subheader("Advanced Options")
-    
-    cluster_markers = st.checkbox("Cluster FEMA Markers", value=True, help="Group nearby FEMA disaster markers (County markers are always visible)")
-    show_legend = st.checkbox("Show Legend", value=True, help="Display map legend")
-
-# Apply filters
-filtered_df = df.copy()
-if selected_risk:
-    filtered_df = filtered_df[filtered_df['risk_category'].isin(selected_risk)]
-if selected_trends:
-    filtered_df = filtered_df[filtered_df['climate_trend'].isin(selected_trends)]
-filtered_df = filtered_df[
-    (filtered_df['climate_fire_risk_score'] >= min_score) &
-    (filtered_df['climate_fire_risk_score'] <= max_score) &
-    (filtered_df['population'] >= min_population)
-]
+
+# Apply filters (cached on the hashable filter tuple)
+filter_key = (
+    tuple(selected_risk),
+    tuple(selected_trends),
+    min_score,
+    max_score,
+    min_population
+)
+filtered_df = apply_filters(*filter_key)
 
 # Display filter results
-col1, col2, col3, col4 = st.columns(4)
+col1, col2, col3 = st.columns(3)
 with col1:
     st.metric("Counties Shown", f"{len(filtered_df)}/{len(df)}")
 with col2:
     st.metric("Avg Risk Score", f"{filtered_df['climate_fire_risk_score'].mean():.1f}")
 with col3:
     st.metric("Total Pop. at Risk", f"{filtered_df['population_at_risk'].sum()/1000:.0f}K")
-with col4:
-    if show_fema and fema_data is not None:
-        fema_filtered = fema_data[
-            (fema_data['declarationDate'].dt.year >= fema_year_range[0]) &
-            (fema_data['declarationDate'].dt.year <= fema_year_range[1])
-        ]
-        st.metric("FEMA Disasters", len(fema_filtered))
-    else:
-        st.metric("FEMA Disasters", "Disabled")
 
 st.markdown("---")
 
 # Create map
 st.subheader("Washington State Wildfire Risk Analysis")
 
-# Map tile options
-tile_options = {
-    "OpenStreetMap": "OpenStreetMap",
-    "Satellite": "https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}",
-    "Terrain": "https://server.arcgisonline.com/ArcGIS/rest/services/World_Terrain_Base/MapServer/tile/{z}/{y}/{x}",
-    "Dark": "CartoDB dark_matter"
-}
+if geojson_data is None:
+    st.warning("County boundary data (GeoJSON) not found. Map markers will not be displayed.")
 
-m = folium.Map(
-    location=[47.5, -120.5],
-    zoom_start=7,
-    tiles=tile_options.get(base_layer, "OpenStreetMap"),
-    attr='WA FireWatch'
-)
 
-# Add choropleth layer for county boundaries
-if geojson_data is not None:
-    folium.Choropleth(
-        geo_data=geojson_data,
-        name='County Risk Levels',
-        data=filtered_df,
-        columns=['county_fips', 'climate_fire_risk_score'],
-        key_on='feature.properties.GEOID',
-        fill_color='YlOrRd',
-        fill_opacity=0.6,
-        line_opacity=0.8,
-        line_weight=2,
-        line_color='white',
-        legend_name='Climate-Fire Risk Score',
-        nan_fill_color='lightgray',
-        nan_fill_opacity=0.2
-    ).add_to(m)
-
-# Add heatmap layer if requested
-if show_heatmap and len(filtered_df) > 0:
-    # Create heatmap data - we'd need lat/lon for counties
-    # For now, using a placeholder
-    st.info("Heatmap layer requires county centroid coordinates. Feature coming soon!")
-
-# Add county markers with detailed popups using GeoJSON centroids
-# Note: County markers are NOT clustered so all are always visible
-if geojson_data is not None:
-    for _, row in filtered_df.iterrows():
-        # Find matching feature in geojson to get centroid coordinates
-        for feature in geojson_data['features']:
-            if feature['properties']['GEOID'] == str(int(row['county_fips'])):
-                # Determine marker color and icon based on risk
-                if row['risk_category'] == 'Critical':
-                    color = 'darkred'
-                    icon = 'fire'
-                elif row['risk_category'] == 'High':
-                    color = 'red'
-                    icon = 'warning-sign'
-                elif row['risk_category'] == 'Moderate':
-                    color = 'orange'
-                    icon = 'exclamation-sign'
-                else:
-                    color = 'green'
-                    icon = 'ok-sign'
-                
-                # Count FEMA disasters for this county
-                if fema_data is not None:
-                    county_fema = fema_data[fema_data['County'] == row['County']]
-                    fema_count = len(county_fema)
-                    recent_fires = county_fema.nlargest(3, 'declarationDate')
-                    fires_list = '<br>'.join([
-                        f"• <b>{fire['declarationTitle']}</b> ({fire['declarationDate'].strftime('%Y-%m-%d')})"
-                        for _, fire in recent_fires.iterrows()
-                    ])
-                else:
-                    fema_count = 0
-                    fires_list = "No data available"
-                
-                # Create detailed popup
-                popup_html = f"""
-                <div style="font-family: Arial, sans-serif; width: 350px; max-height: 400px; overflow-y: auto;">
-                    <div style="background: linear-gradient(135deg, {color} 0%, {color}dd 100%); 
-                                color: white; padding: 15px; margin: -10px -10px 10px -10px; border-radius: 5px 5px 0 0;">
-                        <h3 style="margin: 0; font-size: 1.3rem;">{row['County']} County</h3>
-                        <div style="font-size: 0.9rem; margin-top: 5px;">Risk Score: {row['climate_fire_risk_score']:.1f} | {row['risk_category']}</div>
-                    </div>
-                    
-                    <div style="padding: 5px; color: #333;">
-                        <h4 style="color: #1976d2; margin: 10px 0 5px 0; border-bottom: 2px solid #1976d2;">
-                            Risk Assessment
-                        </h4>
-                        <table style="width: 100%; font-size: 0.9rem;">
-                            <tr><td><b>Climate Trend:</b></td><td>{row['climate_trend']}</td></tr>
-                            <tr><td><b>Heat Stress:</b></td><td>{row['heat_stress']:.1f}</td></tr>
-                            <tr><td><b>Drought Stress:</b></td><td>{row['drought_stress']:.1f}</td></tr>
-                            <tr><td><b>Fire History Score:</b></td><td>{row['fire_history_score']:.1f}</td></tr>
-                            <tr><td><b>WUI Exposure:</b></td><td>{row['wui_exposure_pct']:.1f}%</td></tr>
-                        </table>
-                        
-                        <h4 style="color: #d32f2f; margin: 15px 0 5px 0; border-bottom: 2px solid #d32f2f;">
-                            Federal Disasters: {fema_count}
-                        </h4>
-                        <table style="width: 100%; font-size: 0.9rem;">
-                            <tr><td><b>Population:</b></td><td>{row['population']:,}</td></tr>
-                            <tr><td><b>At Risk (WUI):</b></td><td>{row['population_at_risk']:,.0f}</td></tr>
-                            <tr><td><b>% Interface:</b></td><td>{row['pct_interface']*100:.1f}%</td></tr>
-                            <tr><td><b>% Intermix:</b></td><td>{row['pct_intermix']*100:.1f}%</td></tr>
-                        </table>
-                        
-                        <h4 style="color: #f57c00; margin: 15px 0 5px 0; border-bottom: 2px solid #f57c00;">
-                            Recent Major Fires
-                        </h4>
-                        <div style="font-size: 0.9rem;">
-                            <b>NOAA Fire Events:</b> {row['Fire_Count']}<br>
-                            <br>
-                            {fires_list}
-                        </div>
-                    </div>
-                </div>
-                """
-                
-                # Use polygon centroid from GeoJSON properties
-                lat = float(feature['properties'].get('INTPTLAT', 47.5))
-                lon = float(feature['properties'].get('INTPTLON', -120.5))
-                
-                # Add to map directly (not cluster) so all counties are always visible
-                folium.Marker(
-                    location=[lat, lon],
-                    popup=folium.Popup(popup_html, max_width=400),
-                    tooltip=f"{row['County']}: {row['climate_fire_risk_score']:.1f}",
-                    icon=folium.Icon(color=color, icon=icon, prefix='glyphicon')
-                ).add_to(m)  # Add to map directly, not marker_parent
-                
-                # Add county label if requested
-                if show_county_labels:
-                    folium.Marker(
-                        location=[lat, lon],
-                        icon=folium.DivIcon(html=f"""
-                            <div style="font-size: 10px; font-weight: bold; color: #333; 
-                                        text-shadow: 1px 1px 2px white, -1px -1px 2px white;
-                                        white-space: nowrap;">
-                                {row['County']}
-                            </div>
-                        """)
-                    ).add_to(m)
-                
-                break  # Found the matching GeoJSON feature, move to next county
-else:
-    st.warning("County boundary data (GeoJSON) not found. Map markers will not be displayed.")
+@st.fragment
+def map_fragment(filter_key):
+    """Layer controls and the map itself; toggling a layer reruns only this block"""
+    ctrl1, ctrl2, ctrl3, ctrl4 = st.columns(4)
+    with ctrl1:
+        base_layer = st.selectbox(
+            "Map Style",
+            ["OpenStreetMap", "Satellite", "Terrain", "Dark"],
+            help="Choose base map visualization"
+        )
+        show_legend = st.checkbox("Show Legend", value=True, help="Display map legend")
+    with ctrl2:
+        show_fema = st.checkbox("FEMA Disasters", value=True, help="Show federal disaster declarations")
+        cluster_markers = st.checkbox("Cluster FEMA Markers", value=True, help="Group nearby FEMA disaster markers (County markers are always visible)")
+    with ctrl3:
+        show_county_labels = st.checkbox("County Labels", value=False, help="Display county names on map")
+        show_heatmap = st.checkbox("Risk Heatmap", value=False, help="Show risk intensity heatmap")
+    with ctrl4:
+        fema_year_range = None
+        if show_fema and fema_data is not None:
+            fema_year_range = st.slider(
+                "FEMA Year Range",
+                min_value=min(fema_year_bounds),
+                max_value=max(fema_year_bounds),
+                value=(2015, max(fema_year_bounds))
+            )
+            st.caption(f"{len(fema_in_year_range(fema_sorted, fema_year_bounds, fema_year_range))} FEMA disasters in range")
+        else:
+            st.caption("FEMA layer disabled")
 
-# Add FEMA disaster markers
-if show_fema and fema_data is not None:
-    fema_filtered = fema_data[
-        (fema_data['declarationDate'].dt.year >= fema_year_range[0]) &
-        (fema_data['declarationDate'].dt.year <= fema_year_range[1])
-    ].dropna(subset=['lat', 'lon'])
-    
-    if cluster_markers:
-        fema_cluster = plugins.MarkerCluster(name='FEMA Disasters', 
-                                            overlay=True,
-                                            control=True).add_to(m)
-        fema_parent = fema_cluster
-    else:
-        fema_parent = m
-    
-    for _, row in fema_filtered.iterrows():
-        popup_html = f"""
-        <div style="font-family: Arial; width: 280px;">
-            <div style="background: #c62828; color: white; padding: 10px; margin: -10px -10px 10px -10px;">
-                <h4 style="margin: 0; color: white;">FEMA Disaster</h4>
-            </div>
-            <b>{row['declarationTitle']}</b><br>
-            <b>County:</b> {row['County']}<br>
-            <b>Date:</b> {row['declarationDate'].strftime('%B %d, %Y')}<br>
-            <b>Disaster #:</b> {row['disasterNumber']}<br>
-            <hr style="margin: 8px 0;">
-            <small><i>Federal assistance declaration</i></small>
-        </div>
-        """
-        
-        folium.CircleMarker(
-            location=[row['lat'], row['lon']],
-            radius=6,
-            popup=folium.Popup(popup_html, max_width=300),
-            tooltip=f"{row['declarationTitle']} - {row['declarationDate'].strftime('%Y')}",
-            color='#c62828',
-            fill=True,
-            fillColor='#ff5252',
-            fillOpacity=0.7,
-            weight=2
-        ).add_to(fema_parent)
-
-# Add improved legend if requested
-if show_legend:
-    legend_html = '''
-    <div style="position: fixed; 
-                bottom: 60px; left: 10px; width: 180px; 
-                background-color: rgba(255, 255, 255, 0.95); 
-                border: 2px solid #333; 
-                z-index:9999; 
-                font-size:12px; 
-                padding: 12px; 
-                border-radius: 8px;
-                box-shadow: 0 2px 10px rgba(0,0,0,0.3);">
-        <h4 style="margin: 0 0 8px 0; color: #333; font-size: 13px; border-bottom: 2px solid #333; padding-bottom: 4px;">Risk Categories</h4>
-        <p style="margin: 4px 0; color: #333;"><span style="color: #8B0000; font-size: 16px;">■</span> Critical (&gt;65)</p>
-        <p style="margin: 4px 0; color: #333;"><span style="color: #d32f2f; font-size: 16px;">■</span> High (55-65)</p>
-        <p style="margin: 4px 0; color: #333;"><span style="color: #FFA500; font-size: 16px;">■</span> Moderate (45-55)</p>
-        <p style="margin: 4px 0; color: #333;"><span style="color: #90EE90; font-size: 16px;">■</span> Low (&lt;45)</p>
-        <hr style="margin: 6px 0; border-color: #666;">
-        <p style="margin: 4px 0; color: #333;"><span style="color: #c62828; font-size: 14px;">●</span> FEMA Disaster</p>
-    </div>
-    '''
-    m.get_root().html.add_child(folium.Element(legend_html))
+    # Display map (cached HTML, rebuilt only when the filter or overlay state changes)
+    overlay_key = (
+        base_layer,
+        show_county_labels,
+        show_heatmap,
+        tuple(fema_year_range) if fema_year_range is not None else None,
+        cluster_markers,
+        show_legend
+    )
+    components.html(build_map_html(filter_key, overlay_key), height=700)
 
-# Add layer control
-folium.LayerControl(position='topright').add_to(m)
 
-# Display map
-st_folium(m, width=1400, height=700, returned_objects=[])
+map_fragment(filter_key)
 
 st.markdown("---")
 
@@ -12,28 +12,93 @@ import numpy as np
 from scipy import stats
 from datetime import datetime, timedelta
 
+from utils.data import load_data, load_fema_data
+
 st.set_page_config(
     page_title="Washington State Wildfire Risk Intelligence Platform - Analytics",
     page_icon="📊",
     layout="wide"
 )
 
-# Load data
-@st.cache_data
-def load_data():
-    df = pd.read_csv('data/WA_Climate_Fire_Dashboard_Data.csv')
-    return df
+# Variables shown in the correlation matrix
+CORRELATION_VARS = (
+    'climate_fire_risk_score', 'heat_stress', 'drought_stress',
+    'fire_history_score', 'wui_exposure_score', 'population_at_risk',
+    'Fire_Count', 'wui_exposure_pct'
+)
+
+# Variables summarized in the Statistical Summary table
+SUMMARY_VARS = (
+    'climate_fire_risk_score', 'heat_stress', 'drought_stress',
+    'fire_history_score', 'wui_exposure_score', 'population_at_risk'
+)
+
+# Month labels indexed by month number - 1
+MONTH_NAMES = np.array(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                        'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
 
-@st.cache_data
-def load_fema_data():
-    try:
-        fema = pd.read_csv('data/FEMA_Disasters_Geocoded.csv')
-        fema['declarationDate'] = pd.to_datetime(fema['declarationDate'])
-        fema['year'] = fema['declarationDate'].dt.year
-        return fema
-    except FileNotFoundError:
-        return None
+# Cached derived views
+@st.cache_data(show_spinner=False)
+def unique_vals(col):
+    """Sorted distinct values of a dashboard column, for widget options"""
+    return tuple(sorted(load_data()[col].dropna().unique()))
+
+@st.cache_data(show_spinner=False)
+def yearly_fema():
+    """Per-year FEMA declaration totals and distinct counties affected"""
+    return load_fema_data().groupby('year', sort=True).agg(
+        **{'Total Disasters': ('disasterNumber', 'count'), 'Unique Counties': ('County', 'nunique')}
+    ).rename_axis('Year').reset_index()
+
+def select_counties(county_tuple, risk_tuple):
+    """Dashboard rows matching the sidebar filters (empty selections keep everything)"""
+    df = load_data()
+    # One combined mask; the full frame is returned as-is when nothing is filtered out
+    mask = np.ones(len(df), dtype=bool)
+    if county_tuple:
+        mask &= df['County'].isin(county_tuple).to_numpy()
+    if risk_tuple:
+        mask &= df['risk_category'].isin(risk_tuple).to_numpy()
+    return df if mask.all() else df.loc[mask]
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def correlation_matrix(county_tuple, risk_tuple):
+    """Correlation matrix (ndarray, CORRELATION_VARS order) for the filtered counties"""
+    df = select_counties(county_tuple, risk_tuple)
+    arr = np.ascontiguousarray(df[list(CORRELATION_VARS)].to_numpy(dtype=np.float32))
+    valid = np.isfinite(arr)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if valid.all():
+            return np.corrcoef(arr, rowvar=False)
+        # Pairwise-complete Pearson (same as DataFrame.corr) from a few matrix products
+        mask = valid.astype(np.float64)
+        x = np.where(valid, arr, 0).astype(np.float64)
+        n = mask.T @ mask
+        sums = x.T @ mask
+        cov = x.T @ x - sums * sums.T / n
+        var = (x * x).T @ mask - sums ** 2 / n
+        return cov / np.sqrt(var * var.T)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def filter_summaries(county_tuple, risk_tuple):
+    """describe() table and risk-category ANOVA (None with fewer than two groups) for the filtered counties"""
+    df = select_counties(county_tuple, risk_tuple)
+    summary_stats = df[list(SUMMARY_VARS)].describe()
+    
+    # One groupby pass over the observed categories
+    groups = [
+        scores.to_numpy()
+        for _, scores in df.groupby('risk_category', observed=True)['climate_fire_risk_score']
+    ]
+    anova = tuple(float(v) for v in stats.f_oneway(*groups)) if len(groups) > 1 else None
+    return summary_stats, anova
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def filtered_csv(county_tuple, risk_tuple):
+    """CSV export of the filtered counties, serialized once per filter selection"""
+    return select_counties(county_tuple, risk_tuple).to_csv(index=False).encode('utf-8')
+
+# Load data
 df = load_data()
 fema_data = load_fema_data()
 
@@ -85,22 +150,19 @@ with st.sidebar:
     
     selected_counties = st.multiselect(
         "Focus Counties",
-        sorted(df['County'].unique()),
+        unique_vals('County'),
         help="Leave empty for all counties"
     )
     
     risk_filter = st.multiselect(
         "Risk Categories",
-        sorted(df['risk_category'].unique()),
-        default=sorted(df['risk_category'].unique())
+        unique_vals('risk_category'),
+        default=unique_vals('risk_category')
     )
 
-# Apply filters
-filtered_df = df.copy()
-if selected_counties:
-    filtered_df = filtered_df[filtered_df['County'].isin(selected_counties)]
-if risk_filter:
-    filtered_df = filtered_df[filtered_df['risk_category'].isin(risk_filter)]
+# Apply filters (sorted tuples key the cached views below)
+filter_key = (tuple(sorted(selected_counties)), tuple(sorted(risk_filter)))
+filtered_df = select_counties(*filter_key)
 
 # Main content based on analysis type
 if analysis_type == "Correlation Analysis":
@@ -110,21 +172,18 @@ if analysis_type == "Correlation Analysis":
     # Correlation matrix
     st.subheader("Risk Factor Correlation Matrix")
     
-    correlation_vars = [
-        'climate_fire_risk_score', 'heat_stress', 'drought_stress',
-        'fire_history_score', 'wui_exposure_score', 'population_at_risk',
-        'Fire_Count', 'wui_exposure_pct'
-    ]
+    # Cached on the sorted filter selections, so unrelated widget changes reuse it
+    corr_matrix = correlation_matrix(*filter_key)
     
-    corr_matrix = filtered_df[correlation_vars].corr()
+    corr_labels = [col.replace('_', ' ').title() for col in CORRELATION_VARS]
     
     fig_corr = go.Figure(data=go.Heatmap(
-        z=corr_matrix.values,
-        x=[col.replace('_', ' ').title() for col in corr_matrix.columns],
-        y=[col.replace('_', ' ').title() for col in corr_matrix.index],
+        z=corr_matrix,
+        x=corr_labels,
+        y=corr_labels,
         colorscale='RdBu',
         zmid=0,
-        text=corr_matrix.values.round(2),
+        text=np.char.mod('%.2f', corr_matrix),
         texttemplate='%{text}',
         textfont={"size": 10},
         colorbar=dict(title="Correlation")
@@ -149,6 +208,20 @@ if analysis_type == "Correlation Analysis":
         # Calculate correlation
         correlation = filtered_df[primary_var].corr(filtered_df[secondary_var])
         
+        # Rows where both variables are present, shared by the trend line and regression
+        x_vals = filtered_df[primary_var].to_numpy(dtype=np.float64)
+        y_vals = filtered_df[secondary_var].to_numpy(dtype=np.float64)
+        valid = np.isfinite(x_vals) & np.isfinite(y_vals)
+        x_vals, y_vals = x_vals[valid], y_vals[valid]
+        
+        # One least-squares fit, shared by the trend line and the metrics below
+        regression = None
+        if len(x_vals) > 1:
+            try:
+                regression = stats.linregress(x_vals, y_vals)
+            except ValueError:
+                pass  # All x values identical; no trend line or R²
+        
         fig_scatter = px.scatter(
             filtered_df,
             x=primary_var,
@@ -156,6 +229,7 @@ if analysis_type == "Correlation Analysis":
             color='risk_category',
             size='population',
             hover_data=['County', 'climate_trend'],
+            render_mode='webgl',
             color_discrete_map={
                 'Critical': '#8B0000',
                 'High': '#FF4500',
@@ -164,30 +238,16 @@ if analysis_type == "Correlation Analysis":
             }
         )
         
-        # Add manual trend line using numpy
-        if len(filtered_df) > 1:
-            try:
-                x_data = filtered_df[primary_var].dropna()
-                y_data = filtered_df[secondary_var].dropna()
-                
-                # Ensure we have matching indices
-                common_idx = x_data.index.intersection(y_data.index)
-                x_data = x_data.loc[common_idx]
-                y_data = y_data.loc[common_idx]
-                
-                if len(x_data) > 1 and len(y_data) > 1:
-                    z = np.polyfit(x_data, y_data, 1)
-                    p = np.poly1d(z)
-                    x_trend = np.linspace(x_data.min(), x_data.max(), 100)
-                    fig_scatter.add_trace(go.Scatter(
-                        x=x_trend,
-                        y=p(x_trend),
-                        mode='lines',
-                        name='Trend',
-                        line=dict(color='rgba(0,0,0,0.3)', width=2, dash='dash')
-                    ))
-            except Exception:
-                pass  # Silently skip trend line if calculation fails
+        # Add trend line from the regression fit
+        if regression is not None:
+            x_trend = np.array([x_vals.min(), x_vals.max()])
+            fig_scatter.add_trace(go.Scatter(
+                x=x_trend,
+                y=regression.slope * x_trend + regression.intercept,
+                mode='lines',
+                name='Trend',
+                line=dict(color='rgba(0,0,0,0.3)', width=2, dash='dash')
+            ))
         
         fig_scatter.update_layout(
             title=f"Correlation: {correlation:.3f}",
@@ -205,22 +265,14 @@ if analysis_type == "Correlation Analysis":
             st.metric("Correlation Coefficient", f"{correlation:.3f}")
         
         with col2:
-            # R-squared - ensure matching indices
-            from scipy import stats
-            # Get common indices for both variables
-            valid_idx = filtered_df[[primary_var, secondary_var]].dropna().index
-            x_vals = filtered_df.loc[valid_idx, primary_var]
-            y_vals = filtered_df.loc[valid_idx, secondary_var]
-            
-            if len(x_vals) > 1:
-                slope, intercept, r_value, p_value, std_err = stats.linregress(x_vals, y_vals)
-                st.metric("R² Value", f"{r_value**2:.3f}")
+            if regression is not None:
+                st.metric("R² Value", f"{regression.rvalue**2:.3f}")
             else:
                 st.metric("R² Value", "N/A")
         
         with col3:
-            if len(x_vals) > 1:
-                st.metric("P-value", f"{p_value:.4f}")
+            if regression is not None:
+                st.metric("P-value", f"{regression.pvalue:.4f}")
             else:
                 st.metric("P-value", "N/A")
 
@@ -232,11 +284,7 @@ elif analysis_type == "Time Series Trends":
         # Disaster frequency over time
         st.subheader("Federal Disaster Declarations Over Time")
         
-        yearly_data = fema_data.groupby('year').agg({
-            'disasterNumber': 'count',
-            'County': lambda x: x.nunique()
-        }).reset_index()
-        yearly_data.columns = ['Year', 'Total Disasters', 'Unique Counties']
+        yearly_data = yearly_fema()
         
         # Create figure with secondary y-axis
         fig_timeline = make_subplots(specs=[[{"secondary_y": True}]])
@@ -297,13 +345,13 @@ elif analysis_type == "Time Series Trends":
             # Simple linear regression for projection
             recent_years = yearly_data.tail(10)
             z = np.polyfit(recent_years['Year'], recent_years['Total Disasters'], 1)
-            p = np.poly1d(z)
             
-            future_years = range(yearly_data['Year'].max() + 1, yearly_data['Year'].max() + 6)
-            projected_disasters = [p(year) for year in future_years]
+            last_year = int(yearly_data['Year'].max())
+            future_years = np.arange(last_year + 1, last_year + 6)
+            projected_disasters = np.polyval(z, future_years)
             
             projection_df = pd.DataFrame({
-                'Year': list(future_years),
+                'Year': future_years,
                 'Projected Disasters': projected_disasters
             })
             
@@ -324,7 +372,7 @@ elif analysis_type == "Time Series Trends":
                     delta=f"{(avg_increase / yearly_data['Total Disasters'].iloc[-1] * 100):.1f}%"
                 )
                 
-                total_projected = sum(projected_disasters)
+                total_projected = projected_disasters.sum()
                 st.metric(
                     "5-Year Total (Projected)",
                     f"{total_projected:.0f} disasters"
@@ -333,12 +381,12 @@ elif analysis_type == "Time Series Trends":
         # Seasonal patterns
         st.subheader(" Seasonal Patterns")
         
-        fema_data['month'] = fema_data['declarationDate'].dt.month
-        monthly_disasters = fema_data.groupby('month').size().reset_index(name='count')
-        
-        month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        monthly_disasters['month_name'] = monthly_disasters['month'].apply(lambda x: month_names[x-1])
+        # All twelve months in calendar order, labelled from a static index
+        month_counts = fema_data['month'].value_counts().reindex(range(1, 13), fill_value=0)
+        monthly_disasters = pd.DataFrame({
+            'month_name': MONTH_NAMES,
+            'count': month_counts.to_numpy()
+        })
         
         fig_seasonal = px.bar(
             monthly_disasters,
@@ -353,8 +401,8 @@ elif analysis_type == "Time Series Trends":
         fig_seasonal.update_layout(height=400)
         st.plotly_chart(fig_seasonal, width="stretch")
         
-        peak_month = monthly_disasters.nlargest(1, 'count')['month_name'].values[0]
-        st.info(f"🔥 **Peak Fire Season:** {peak_month} with {monthly_disasters.nlargest(1, 'count')['count'].values[0]} historical declarations")
+        peak_row = monthly_disasters.nlargest(1, 'count').iloc[0]
+        st.info(f"🔥 **Peak Fire Season:** {peak_row['month_name']} with {peak_row['count']} historical declarations")
 
 elif analysis_type == "Risk Factor Decomposition":
     st.header(" Risk Factor Decomposition")
@@ -392,21 +440,34 @@ elif analysis_type == "Risk Factor Decomposition":
     # Component distribution by risk category
     st.subheader("Component Scores by Risk Category")
     
-    fig_box = go.Figure()
+    # Long form: one box trace per risk category, grouped along the component axis
+    component_scores = filtered_df.melt(
+        id_vars='risk_category',
+        value_vars=components,
+        var_name='component',
+        value_name='score'
+    )
+    component_scores['component'] = component_scores['component'].str.replace('_', ' ').str.title()
     
-    for comp in components:
-        for category in sorted(filtered_df['risk_category'].unique()):
-            category_data = filtered_df[filtered_df['risk_category'] == category][comp]
-            
-            fig_box.add_trace(go.Box(
-                y=category_data,
-                name=f"{category} - {comp.replace('_', ' ').title()}",
-                boxmean='sd'
-            ))
+    fig_box = px.box(
+        component_scores,
+        x='component',
+        y='score',
+        color='risk_category',
+        color_discrete_map={
+            'Critical': '#8B0000',
+            'High': '#FF4500',
+            'Moderate': '#FFA500',
+            'Low': '#90EE90'
+        }
+    )
+    fig_box.update_traces(boxmean='sd')
     
     fig_box.update_layout(
         title="Risk Component Distributions",
+        xaxis_title="",
         yaxis_title="Score",
+        legend_title="Risk Category",
         height=500,
         showlegend=True
     )
@@ -423,7 +484,7 @@ elif analysis_type == "Risk Factor Decomposition":
     
     county_data = filtered_df[filtered_df['County'] == selected_county].iloc[0]
     
-    county_components = [county_data[comp] for comp in components]
+    county_components = county_data[components].to_numpy(dtype=np.float32)
     
     fig_radar = go.Figure(data=go.Scatterpolar(
         r=county_components,
@@ -492,37 +553,43 @@ elif analysis_type == "Predictive Modeling":
     temp_factor = 1 + (temp_increase * 0.15)  # 15% increase per degree
     precip_factor = 1 - (precip_change / 100 * 0.1)  # 10% of precip change affects risk
     
-    filtered_df['projected_heat_stress'] = filtered_df['heat_stress'] * temp_factor
-    filtered_df['projected_drought_stress'] = filtered_df['drought_stress'] * precip_factor
-    filtered_df['projected_risk_score'] = (
-        filtered_df['projected_heat_stress'] * 0.25 +
-        filtered_df['projected_drought_stress'] * 0.25 +
-        filtered_df['fire_history_score'] * 0.25 +
-        filtered_df['wui_exposure_score'] * 0.25
+    # Computed on float32 arrays into a fresh frame; filtered_df itself is not modified
+    current_risk = filtered_df['climate_fire_risk_score'].to_numpy(dtype=np.float32)
+    projected_risk = 0.25 * (
+        filtered_df['heat_stress'].to_numpy(dtype=np.float32) * temp_factor +
+        filtered_df['drought_stress'].to_numpy(dtype=np.float32) * precip_factor +
+        filtered_df['fire_history_score'].to_numpy(dtype=np.float32) +
+        filtered_df['wui_exposure_score'].to_numpy(dtype=np.float32)
     )
+    risk_change = projected_risk - current_risk
     
     # Show changes
     st.subheader("Projected Risk Changes")
     
-    risk_changes = filtered_df[['County', 'climate_fire_risk_score', 'projected_risk_score', 'risk_category']].copy()
-    risk_changes['risk_change'] = risk_changes['projected_risk_score'] - risk_changes['climate_fire_risk_score']
-    risk_changes['pct_change'] = (risk_changes['risk_change'] / risk_changes['climate_fire_risk_score'] * 100)
+    risk_changes = pd.DataFrame({
+        'County': filtered_df['County'].values,
+        'climate_fire_risk_score': current_risk,
+        'projected_risk_score': projected_risk,
+        'risk_category': filtered_df['risk_category'].values,
+        'risk_change': risk_change,
+        'pct_change': risk_change / current_risk * 100
+    })
     
-    # Sort by largest increase
-    risk_changes = risk_changes.sort_values('risk_change', ascending=False)
+    # Largest increases (partial selection; only the detail table needs a full sort)
+    top_changes = risk_changes.nlargest(15, 'risk_change')
     
     fig_changes = go.Figure()
     
     fig_changes.add_trace(go.Bar(
-        x=risk_changes['County'][:15],
-        y=risk_changes['climate_fire_risk_score'][:15],
+        x=top_changes['County'],
+        y=top_changes['climate_fire_risk_score'],
         name='Current Risk',
         marker_color='#1976d2'
     ))
     
     fig_changes.add_trace(go.Bar(
-        x=risk_changes['County'][:15],
-        y=risk_changes['projected_risk_score'][:15],
+        x=top_changes['County'],
+        y=top_changes['projected_risk_score'],
         name='Projected Risk',
         marker_color='#d32f2f'
     ))
@@ -554,13 +621,15 @@ elif analysis_type == "Predictive Modeling":
         st.metric("Maximum Increase", f"+{max_increase:.1f}")
     
     with col4:
-        most_affected = risk_changes.nlargest(1, 'risk_change')['County'].values[0]
+        most_affected = top_changes['County'].iloc[0]
         st.metric("Most Affected County", most_affected)
     
     # Display table
     st.subheader("Detailed Projections")
     
-    display_changes = risk_changes[['County', 'climate_fire_risk_score', 'projected_risk_score', 'risk_change', 'pct_change']].copy()
+    display_changes = risk_changes.sort_values('risk_change', ascending=False)[
+        ['County', 'climate_fire_risk_score', 'projected_risk_score', 'risk_change', 'pct_change']
+    ]
     display_changes.columns = ['County', 'Current Risk', 'Projected Risk', 'Change', '% Change']
     display_changes = display_changes.round(2)
     
@@ -575,12 +644,14 @@ elif analysis_type == "Comparative Analysis":
     
     compare_counties = st.multiselect(
         "Choose 2-5 counties",
-        sorted(df['County'].unique()),
-        default=df.nlargest(3, 'climate_fire_risk_score')['County'].tolist()[:3]
+        unique_vals('County'),
+        default=df.nlargest(3, 'climate_fire_risk_score')['County'].tolist()
     )
     
     if len(compare_counties) >= 2:
         compare_df = df[df['County'].isin(compare_counties)]
+        # One row per selected county, in selection order
+        compare_rows = compare_df.set_index('County').loc[compare_counties]
         
         # Radar chart comparison
         st.subheader("Risk Profile Comparison")
@@ -591,10 +662,9 @@ elif analysis_type == "Comparative Analysis":
         
         colors = ['#d32f2f', '#1976d2', '#f57c00', '#7cb342', '#9c27b0']
         
-        for idx, county in enumerate(compare_counties):
-            county_data = compare_df[compare_df['County'] == county].iloc[0]
-            values = [county_data[comp] for comp in components]
-            
+        compare_values = compare_rows[components].to_numpy(dtype=np.float32)
+        
+        for idx, (county, values) in enumerate(zip(compare_counties, compare_values)):
             fig_compare.add_trace(go.Scatterpolar(
                 r=values,
                 theta=[comp.replace('_', ' ').title() for comp in components],
@@ -629,7 +699,7 @@ elif analysis_type == "Comparative Analysis":
         for idx, county in enumerate(compare_counties):
             with cols[idx]:
                 st.markdown(f"### {county}")
-                county_data = compare_df[compare_df['County'] == county].iloc[0]
+                county_data = compare_rows.loc[county]
                 
                 for metric, label in metrics_to_compare:
                     value = county_data[metric]
@@ -666,9 +736,8 @@ else:  # Statistical Summary
     
     st.subheader("Distribution Statistics")
     
-    # Summary statistics
-    summary_stats = filtered_df[['climate_fire_risk_score', 'heat_stress', 'drought_stress', 
-                                 'fire_history_score', 'wui_exposure_score', 'population_at_risk']].describe()
+    # Summary statistics and ANOVA, cached on the filter selections
+    summary_stats, anova = filter_summaries(*filter_key)
     
     st.dataframe(summary_stats.T.style.format("{:.2f}"), width="stretch")
     
@@ -702,17 +771,16 @@ else:  # Statistical Summary
     
     components = ['heat_stress', 'drought_stress', 'fire_history_score', 'wui_exposure_score']
     
-    fig_boxes = go.Figure()
+    component_scores = filtered_df[components].melt(var_name='component', value_name='score')
+    component_scores['component'] = component_scores['component'].str.replace('_', ' ').str.title()
     
-    for comp in components:
-        fig_boxes.add_trace(go.Box(
-            y=filtered_df[comp],
-            name=comp.replace('_', ' ').title(),
-            boxmean='sd'
-        ))
+    # A single box trace across all four components
+    fig_boxes = px.box(component_scores, x='component', y='score', points=False)
+    fig_boxes.update_traces(boxmean='sd')
     
     fig_boxes.update_layout(
         title="Risk Component Statistical Distribution",
+        xaxis_title="",
         yaxis_title="Score",
         height=500
     )
@@ -723,11 +791,8 @@ else:  # Statistical Summary
     st.subheader("Statistical Significance Tests")
     
     # ANOVA for risk categories
-    categories = filtered_df['risk_category'].unique()
-    if len(categories) > 1:
-        groups = [filtered_df[filtered_df['risk_category'] == cat]['climate_fire_risk_score'].values 
-                 for cat in categories]
-        f_stat, p_value = stats.f_oneway(*groups)
+    if anova is not None:
+        f_stat, p_value = anova
         
         col1, col2 = st.columns(2)
         with col1:
@@ -748,10 +813,9 @@ st.subheader(" Export Analysis Results")
 col1, col2, col3 = st.columns(3)
 
 with col1:
-    csv = filtered_df.to_csv(index=False)
     st.download_button(
         label="📥 Download Filtered Data",
-        data=csv,
+        data=filtered_csv(*filter_key),
         file_name=f"wa_firewatch_analytics_{pd.Timestamp.now().strftime('%Y%m%d')}.csv",
         mime="text/csv"
     )
@@ -4,174 +4,180 @@ Custom report builder with PDF export and email capabilities
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
+import numpy as np
 from datetime import datetime
+from textwrap import dedent
 import io
 
+from utils.data import CountyRecord, load_data, load_fema_data
+from utils.helpers import WARMING_TRENDS, gauge_chart_spec
+
 st.set_page_config(
     page_title="Washington State Wildfire Risk Intelligence Platform - Reports",
     page_icon="📄",
     layout="wide"
 )
 
-# Load data
-@st.cache_data
-def load_data():
-    df = pd.read_csv('data/WA_Climate_Fire_Dashboard_Data.csv')
-    return df
-
-@st.cache_data
-def load_fema_data():
-    try:
-        fema = pd.read_csv('data/FEMA_Disasters_Geocoded.csv')
-        fema['declarationDate'] = pd.to_datetime(fema['declarationDate'])
-        return fema
-    except FileNotFoundError:
-        return None
+# Counties grouped as Eastern Washington in the regional report. Deliberately narrower than
+# utils.helpers.EASTERN_COUNTIES (all twenty counties east of the Cascades): the report
+# keeps the eleven-county region it has always used, so its figures stay comparable
+# between report runs
+REPORT_EASTERN_COUNTIES = frozenset({
+    'SPOKANE', 'YAKIMA', 'BENTON', 'FRANKLIN', 'WALLA WALLA',
+    'GRANT', 'CHELAN', 'DOUGLAS', 'OKANOGAN', 'ADAMS', 'WHITMAN'
+})
 
-df = load_data()
-fema_data = load_fema_data()
+# County entries in the report previews, filled per row with str.format
+TOP_COUNTY_TEMPLATE = """{County} County
+- Risk Score: {climate_fire_risk_score:.1f} ({risk_category})
+- Climate Trend: {climate_trend}
+- Population at Risk: {population_at_risk:,.0f}
+"""
 
-# Header
-st.title("📄 Report Generation Center")
-st.markdown("Create custom reports for stakeholders and decision-makers")
-st.markdown("---")
+REGIONAL_COUNTY_TEMPLATE = """### {County} County
+- Risk Score: {climate_fire_risk_score:.1f}
+- Category: {risk_category}
+- Population at Risk: {population_at_risk:,.0f}
+- Climate Trend: {climate_trend}
+"""
 
-# Sidebar - Report Configuration
-with st.sidebar:
-    st.header(" Report Configuration")
-    
-    report_type = st.selectbox(
-        "Report Type",
-        [
-            "Executive Summary",
-            "County Risk Assessment",
-            "Regional Analysis",
-            "Mitigation Planning",
-            "Historical Analysis",
-            "Custom Report"
-        ]
-    )
-    
-    st.markdown("---")
-    
-    st.subheader("Scope")
-    
-    if report_type == "County Risk Assessment":
-        selected_counties = st.multiselect(
-            "Select Counties",
-            sorted(df['County'].unique()),
-            default=[df.nlargest(1, 'climate_fire_risk_score')['County'].values[0]]
-        )
-    elif report_type == "Regional Analysis":
-        region = st.selectbox(
-            "Select Region",
-            ["Eastern Washington", "Western Washington", "Statewide", "Custom"]
-        )
-        
-        if region == "Custom":
-            selected_counties = st.multiselect(
-                "Select Counties",
-                sorted(df['County'].unique())
-            )
-    else:
-        selected_counties = []
-    
-    st.markdown("---")
-    
-    st.subheader("Content Sections")
-    
-    include_summary = st.checkbox("Executive Summary", value=True)
-    include_risk_maps = st.checkbox("Risk Maps", value=True)
-    include_statistics = st.checkbox("Statistical Analysis", value=True)
-    include_trends = st.checkbox("Historical Trends", value=True)
-    include_projections = st.checkbox("Future Projections", value=False)
-    include_recommendations = st.checkbox("Recommendations", value=True)
-    include_appendix = st.checkbox("Data Appendix", value=False)
-    
-    st.markdown("---")
-    
-    st.subheader("Format Options")
-    
-    report_format = st.selectbox(
-        "Output Format",
-        ["PDF", "HTML", "Word Document", "PowerPoint"]
-    )
-    
-    include_charts = st.checkbox("Include Charts/Graphs", value=True)
-    include_tables = st.checkbox("Include Data Tables", value=True)
-    color_scheme = st.selectbox(
-        "Color Scheme",
-        ["Professional", "High Contrast", "Grayscale"]
-    )
+# Component score panel beside each county gauge, one markdown write per county
+COMPONENT_SCORES_TEMPLATE = """### Component Scores
 
-# Main content area
-if report_type == "Executive Summary":
-    st.header(" Executive Summary Report")
-    st.markdown("High-level overview for leadership and stakeholders")
-    
-    # Preview
-    st.subheader("Report Preview")
-    
-    with st.expander("📄 View Report Content", expanded=True):
-        st.markdown(f"""
+<table style='width: 100%; font-size: 1.1rem;'>
+    <tr><td>Heat Stress</td><td style='text-align: right;'><b>{county.heat_stress:.1f}</b></td></tr>
+    <tr><td>Drought Stress</td><td style='text-align: right;'><b>{county.drought_stress:.1f}</b></td></tr>
+    <tr><td>Fire History</td><td style='text-align: right;'><b>{county.fire_history_score:.1f}</b></td></tr>
+    <tr><td>WUI Exposure</td><td style='text-align: right;'><b>{county.wui_exposure_score:.1f}</b></td></tr>
+</table>
+"""
+
+# County gauge bar colour per risk category (the bands come from utils.helpers)
+GAUGE_BAR_COLORS = {'Critical': "darkred", 'High': "red", 'Moderate': "orange", 'Low': "green"}
+
+# Cached derived views
+@st.cache_data(show_spinner=False)
+def region_index():
+    """Row positions of the Eastern and Western Washington counties in the dashboard frame"""
+    eastern = load_data()['County'].isin(REPORT_EASTERN_COUNTIES).to_numpy()
+    return {
+        'Eastern Washington': np.flatnonzero(eastern),
+        'Western Washington': np.flatnonzero(~eastern)
+    }
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def risk_summary(counties=None):
+    """Category/trend counts, threshold tallies and totals for all counties or a county tuple"""
+    df = load_data()
+    if counties is not None:
+        df = df[df['County'].isin(counties)]
+    return {
+        'county_count': len(df),
+        'risk_counts': df['risk_category'].value_counts().to_dict(),
+        'trend_counts': df['climate_trend'].value_counts().to_dict(),
+        'warming_count': int(df['climate_trend'].isin(WARMING_TRENDS).sum()),
+        'heat_gt20': int((df['heat_stress'] > 20).sum()),
+        'drought_gt10': int((df['drought_stress'] > 10).sum()),
+        'avg_risk_score': float(df['climate_fire_risk_score'].mean()),
+        'population': int(df['population'].sum()),
+        'population_at_risk': float(df['population_at_risk'].sum()),
+        'avg_wui_pct': float(df['wui_exposure_pct'].mean())
+    }
+
+@st.cache_data(show_spinner=False)
+def county_choices():
+    """County names for the sidebar pickers (the categorical's categories are already sorted)"""
+    return tuple(load_data()['County'].cat.categories)
+
+@st.cache_data(show_spinner=False)
+def county_records():
+    """Dashboard rows as CountyRecord objects keyed by county name"""
+    return {row['County']: CountyRecord(**row) for row in load_data().to_dict('records')}
+
+@st.cache_data(show_spinner=False)
+def fema_by_county(k=3):
+    """Map each county to its FEMA declaration count and k most recent declarations"""
+    fema = load_fema_data()
+    if fema is None:
+        return {}
+    return {
+        county: (len(group), group.nlargest(k, 'declarationDate')[['declarationTitle', 'declarationDate']].to_dict('records'))
+        for county, group in fema.groupby('County', observed=True)
+    }
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def top_counties(n, counties=None):
+    """The n highest-risk counties (all or within a county tuple) as a list of row dicts"""
+    df = load_data()
+    if counties is not None:
+        df = df[df['County'].isin(counties)]
+    return df.nlargest(n, 'climate_fire_risk_score').to_dict('records')
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def top_counties_markdown(template, n, counties=None):
+    """The top-n county entries rendered through template and joined into one markdown block"""
+    return '\n'.join(template.format(**row) for row in top_counties(n, counties))
+
+@st.cache_data(show_spinner=False)
+def executive_summary_md(report_date, include_summary=True, include_trends=True, include_recommendations=True):
+    """The Executive Summary preview as one markdown string, with only the selected sections built"""
+    summary = risk_summary()
+    sections = [dedent(f"""
         # Washington State Wildfire Risk Intelligence Report
         ## Executive Summary
         
-        **Date:** {datetime.now().strftime('%B %d, %Y')}  
+        **Date:** {report_date}  
         **Prepared by:** WA FireWatch Platform  
         **Classification:** For Official Use Only
-        
+        """)]
+    
+    if include_summary:
+        sections += [
+            dedent(f"""
         ---
         
         ### Key Findings
         
         **Overall Risk Assessment:**
-        - **{len(df[df['risk_category'] == 'Critical'])}** counties classified as Critical Risk
-        - **{len(df[df['risk_category'] == 'High'])}** counties classified as High Risk
-        - **{df['population_at_risk'].sum() / 1000000:.2f} million** residents in high-risk WUI areas
-        - **{len(df[df['climate_trend'].str.contains('Warming', na=False)])}** counties showing concerning climate trends
+        - **{summary['risk_counts'].get('Critical', 0)}** counties classified as Critical Risk
+        - **{summary['risk_counts'].get('High', 0)}** counties classified as High Risk
+        - **{summary['population_at_risk'] / 1000000:.2f} million** residents in high-risk WUI areas
+        - **{summary['warming_count']}** counties showing concerning climate trends
         
         **Top Risk Counties:**
-        """)
-        
-        top_5 = df.nlargest(5, 'climate_fire_risk_score')
-        for idx, row in top_5.iterrows():
-            st.markdown(f"""
-            {row['County']} County
-            - Risk Score: {row['climate_fire_risk_score']:.1f} ({row['risk_category']})
-            - Climate Trend: {row['climate_trend']}
-            - Population at Risk: {row['population_at_risk']:,.0f}
-            """)
-        
-        st.markdown("""
+        """),
+            top_counties_markdown(TOP_COUNTY_TEMPLATE, 5)
+        ]
+    
+    if include_trends:
+        sections.append(dedent(f"""
         ---
         
         ### Critical Trends
         
         **Climate Change Impact:**
-        - Increasing heat stress in {len(df[df['heat_stress'] > 20])} counties
-        - Drought conditions affecting {len(df[df['drought_stress'] > 10])} counties
-        - Warming & drying pattern observed in {len(df[df['climate_trend'] == 'Warming & Drying'])} counties
+        - Increasing heat stress in {summary['heat_gt20']} counties
+        - Drought conditions affecting {summary['drought_gt10']} counties
+        - Warming & drying pattern observed in {summary['trend_counts'].get('Warming & Drying', 0)} counties
         
         **Historical Context:**
-        """)
-        
-        if fema_data is not None:
-            recent_disasters = len(fema_data[fema_data['declarationDate'] >= '2020-01-01'])
-            st.markdown(f"""
-            - **{len(fema_data)}** federal fire disaster declarations since 1991
-            - **{recent_disasters}** disasters in the last 5 years
-            - Average of **{len(fema_data) / (2024 - 1991):.1f}** disasters per year
-            """)
-        
-        st.markdown("""
+        """))
+        fema = load_fema_data()
+        if fema is not None:
+            recent_disasters = int((fema['declarationDate'] >= '2020-01-01').sum())
+            sections.append(dedent(f"""
+        - **{len(fema)}** federal fire disaster declarations since 1991
+        - **{recent_disasters}** disasters in the last 5 years
+        - Average of **{len(fema) / (2024 - 1991):.1f}** disasters per year
+        """))
+    
+    if include_recommendations:
+        sections.append(dedent(f"""
         ---
         
         ### Immediate Priorities
         
-        1. **Critical Risk Mitigation** - Deploy resources to {len(df[df['risk_category'] == 'Critical'])} critical counties
+        1. **Critical Risk Mitigation** - Deploy resources to {summary['risk_counts'].get('Critical', 0)} critical counties
         2. **WUI Defensible Space** - Expand programs in high-exposure areas
         3. **Climate Adaptation** - Develop strategies for warming trend counties
         4. **Resource Pre-positioning** - Stage equipment in highest-risk areas
@@ -210,7 +216,9 @@ if report_type == "Executive Summary":
         - Integrate climate adaptation into all planning
         - Develop regional coordination frameworks
         - Invest in predictive modeling capabilities
-        
+        """))
+    
+    sections.append(dedent("""
         ---
         
         ### Conclusion
@@ -220,14 +228,172 @@ if report_type == "Executive Summary":
         **For additional analysis or specific county assessments, contact:**  
         Josh Curry, Emergency Management Specialist  
         josh.curry@wa.gov
-        """)
+        """))
+    return '\n'.join(sections)
+
+def regional_report_md(region_name, region_key, report_date, include_summary=True, include_recommendations=True):
+    """The Regional Analysis report body as one markdown string, with only the enabled sections"""
+    region_summary = risk_summary(region_key)
+    sections = [dedent(f"""
+        # {region_name} Wildfire Risk Analysis
+        
+        **Analysis Date:** {report_date}  
+        **Counties Included:** {region_summary['county_count']}
+        
+        ---
+        """)]
+    
+    if include_summary:
+        sections.append(dedent(f"""
+        ## Regional Summary
+        
+        ### Risk Distribution
+        - **Critical Risk:** {region_summary['risk_counts'].get('Critical', 0)} counties
+        - **High Risk:** {region_summary['risk_counts'].get('High', 0)} counties
+        - **Moderate Risk:** {region_summary['risk_counts'].get('Moderate', 0)} counties
+        - **Low Risk:** {region_summary['risk_counts'].get('Low', 0)} counties
+        
+        ### Regional Averages
+        - **Average Risk Score:** {region_summary['avg_risk_score']:.1f}
+        - **Total Population:** {region_summary['population']:,}
+        - **Population at Risk:** {region_summary['population_at_risk']:,.0f}
+        - **Average WUI Exposure:** {region_summary['avg_wui_pct']:.1f}%
+        
+        ### Climate Trends
+        - **Warming & Drying:** {region_summary['trend_counts'].get('Warming & Drying', 0)} counties
+        - **Warming:** {region_summary['trend_counts'].get('Warming', 0)} counties
+        - **Stable:** {region_summary['trend_counts'].get('Stable', 0)} counties
+        
+        ---
+        """))
+    
+    sections.append("## Highest Risk Counties\n")
+    sections.append(top_counties_markdown(REGIONAL_COUNTY_TEMPLATE, 10, region_key))
+    
+    if include_recommendations:
+        sections.append(dedent("""
+        ---
+        
+        ## Regional Recommendations
+        
+        ### Priority Actions
+        1. Coordinate inter-county mutual aid agreements
+        2. Establish regional resource sharing protocols
+        3. Develop unified public education campaigns
+        4. Create regional evacuation coordination plans
+        5. Share best practices across jurisdictions
+        
+        ### Resource Allocation
+        - Focus on counties with Critical and High risk classifications
+        - Pre-position equipment in highest-risk areas
+        - Establish regional coordination centers
+        - Develop shared GIS and intelligence platforms
+        """))
+    return '\n'.join(sections)
+
+# Load data; FEMA declarations are read by the cached views of the reports that cite them
+df = load_data()
+
+# Report date, read once per run; the day-level string also keys the cached report text
+today = datetime.now()
+report_date = today.strftime('%B %d, %Y')
+
+# Header
+st.title("📄 Report Generation Center")
+st.markdown("Create custom reports for stakeholders and decision-makers")
+st.markdown("---")
+
+# Sidebar - Report Configuration
+with st.sidebar:
+    st.header(" Report Configuration")
+    
+    report_type = st.selectbox(
+        "Report Type",
+        [
+            "Executive Summary",
+            "County Risk Assessment",
+            "Regional Analysis",
+            "Mitigation Planning",
+            "Historical Analysis",
+            "Custom Report"
+        ]
+    )
+    
+    st.markdown("---")
+    
+    st.subheader("Scope")
+    
+    if report_type == "County Risk Assessment":
+        selected_counties = st.multiselect(
+            "Select Counties",
+            county_choices(),
+            default=[top_counties(1)[0]['County']]
+        )
+    elif report_type == "Regional Analysis":
+        region = st.selectbox(
+            "Select Region",
+            ["Eastern Washington", "Western Washington", "Statewide", "Custom"]
+        )
+        
+        if region == "Custom":
+            selected_counties = st.multiselect(
+                "Select Counties",
+                county_choices()
+            )
+    else:
+        selected_counties = []
+    
+    st.markdown("---")
+    
+    # Options that don't change the report data are batched in a form, so
+    # toggling them doesn't rerun the page until the report is re-rendered
+    with st.form("report_options", border=False):
+        st.subheader("Content Sections")
+        
+        include_summary = st.checkbox("Executive Summary", value=True)
+        include_risk_maps = st.checkbox("Risk Maps", value=True)
+        include_statistics = st.checkbox("Statistical Analysis", value=True)
+        include_trends = st.checkbox("Historical Trends", value=True)
+        include_projections = st.checkbox("Future Projections", value=False)
+        include_recommendations = st.checkbox("Recommendations", value=True)
+        include_appendix = st.checkbox("Data Appendix", value=False)
+        
+        st.markdown("---")
+        
+        st.subheader("Format Options")
+        
+        report_format = st.selectbox(
+            "Output Format",
+            ["PDF", "HTML", "Word Document", "PowerPoint"]
+        )
+        
+        include_charts = st.checkbox("Include Charts/Graphs", value=True)
+        include_tables = st.checkbox("Include Data Tables", value=True)
+        color_scheme = st.selectbox(
+            "Color Scheme",
+            ["Professional", "High Contrast", "Grayscale"]
+        )
+        
+        st.form_submit_button("🔄 Render Report", width="stretch")
+
+# Main content area
+if report_type == "Executive Summary":
+    st.header(" Executive Summary Report")
+    st.markdown("High-level overview for leadership and stakeholders")
+    
+    # Preview
+    st.subheader("Report Preview")
+    
+    with st.expander("📄 View Report Content", expanded=True):
+        st.markdown(executive_summary_md(report_date, include_summary, include_trends, include_recommendations))
 
 elif report_type == "County Risk Assessment":
     st.header("🏘️ County Risk Assessment Report")
     
     if selected_counties:
+        records = county_records()
         for county in selected_counties:
-            county_data = df[df['County'] == county].iloc[0]
+            county_data = records[county]
             
             with st.expander(f"📍 {county} County Report", expanded=True):
                 col1, col2 = st.columns([2, 1])
@@ -236,89 +402,92 @@ elif report_type == "County Risk Assessment":
                     st.markdown(f"""
                     # {county} County Wildfire Risk Assessment
                     
-                    **Assessment Date:** {datetime.now().strftime('%B %d, %Y')}
+                    **Assessment Date:** {report_date}
                     
                     ---
                     
                     ## Executive Summary
                     
-                    **Overall Risk Classification:** {county_data['risk_category']}  
-                    **Climate-Fire Risk Score:** {county_data['climate_fire_risk_score']:.1f} / 100
+                    **Overall Risk Classification:** {county_data.risk_category}  
+                    **Climate-Fire Risk Score:** {county_data.climate_fire_risk_score:.1f} / 100
                     
-                    {county} County is classified as **{county_data['risk_category']}** risk with a composite score of {county_data['climate_fire_risk_score']:.1f}. 
-                    The county shows a **{county_data['climate_trend']}** climate pattern and has experienced **{county_data['Fire_Count']}** recorded fire events.
+                    {county} County is classified as **{county_data.risk_category}** risk with a composite score of {county_data.climate_fire_risk_score:.1f}. 
+                    The county shows a **{county_data.climate_trend}** climate pattern and has experienced **{county_data.Fire_Count}** recorded fire events.
                     
                     ---
                     
                     ## Risk Factor Analysis
                     
                     ### Climate Factors
-                    - **Heat Stress Index:** {county_data['heat_stress']:.2f}
-                    - **Drought Stress Index:** {county_data['drought_stress']:.2f}
-                    - **Climate Trend:** {county_data['climate_trend']}
-                    - **Temperature Anomaly (Mean):** {county_data['TMAX_Z_mean']:.2f}°C
-                    - **Precipitation Anomaly (Mean):** {county_data['PRCP_Z_mean']:.2f} inches
+                    - **Heat Stress Index:** {county_data.heat_stress:.2f}
+                    - **Drought Stress Index:** {county_data.drought_stress:.2f}
+                    - **Climate Trend:** {county_data.climate_trend}
+                    - **Temperature Anomaly (Mean):** {county_data.TMAX_Z_mean:.2f}°C
+                    - **Precipitation Anomaly (Mean):** {county_data.PRCP_Z_mean:.2f} inches
                     
                     ### Fire History
-                    - **Historical Fire Events:** {county_data['Fire_Count']}
-                    - **Fire History Score:** {county_data['fire_history_score']:.2f}
+                    - **Historical Fire Events:** {county_data.Fire_Count}
+                    - **Fire History Score:** {county_data.fire_history_score:.2f}
                     """)
                     
-                    if fema_data is not None:
-                        county_fema = fema_data[fema_data['County'] == county]
-                        if len(county_fema) > 0:
-                            st.markdown(f"- **FEMA Disaster Declarations:** {len(county_fema)}")
-                            st.markdown("- **Recent Disasters:**")
-                            for _, fire in county_fema.nlargest(3, 'declarationDate').iterrows():
-                                st.markdown(f"  - {fire['declarationTitle']} ({fire['declarationDate'].strftime('%Y')})")
+                    # Empty when the FEMA file is unavailable
+                    fema_count, recent_fires = fema_by_county().get(county, (0, [])) if include_trends else (0, [])
+                    if fema_count > 0:
+                        st.markdown(f"- **FEMA Disaster Declarations:** {fema_count}")
+                        st.markdown("- **Recent Disasters:**")
+                        for fire in recent_fires:
+                            st.markdown(f"  - {fire['declarationTitle']} ({fire['declarationDate'].strftime('%Y')})")
                     
                     st.markdown(f"""
                     ### Wildland-Urban Interface
-                    - **WUI Exposure Score:** {county_data['wui_exposure_score']:.2f}
-                    - **Interface Areas:** {county_data['pct_interface'] * 100:.1f}%
-                    - **Intermix Areas:** {county_data['pct_intermix'] * 100:.1f}%
-                    - **Overall WUI Exposure:** {county_data['wui_exposure_pct']:.1f}%
+                    - **WUI Exposure Score:** {county_data.wui_exposure_score:.2f}
+                    - **Interface Areas:** {county_data.interface_pct:.1f}%
+                    - **Intermix Areas:** {county_data.intermix_pct:.1f}%
+                    - **Overall WUI Exposure:** {county_data.wui_exposure_pct:.1f}%
                     
                     ### Population Impact
-                    - **Total Population:** {county_data['population']:,}
-                    - **Population at Risk:** {county_data['population_at_risk']:,.0f}
-                    - **Mean Population Density:** {county_data['mean_pop_density']:.1f} per sq mi
-                    - **Average Housing Density:** {county_data['avg_housing_density']:.1f} per sq mi
+                    - **Total Population:** {county_data.population:,}
+                    - **Population at Risk:** {county_data.population_at_risk:,.0f}
+                    - **Mean Population Density:** {county_data.mean_pop_density:.1f} per sq mi
+                    - **Average Housing Density:** {county_data.avg_housing_density:.1f} per sq mi
                     
                     ---
-                    
-                    ## Recommendations
-                    
-                    ### Immediate Actions (0-6 months)
                     """)
                     
-                    if county_data['risk_category'] in ['Critical', 'High']:
+                    if include_recommendations:
                         st.markdown("""
-                        1. **Emergency Mitigation Planning** - Initiate county-wide risk reduction strategies
-                        2. **Community Outreach** - Launch public education on fire preparedness
-                        3. **Evacuation Planning** - Update and test evacuation routes
-                        4. **Resource Staging** - Pre-position firefighting equipment
-                        5. **Defensible Space** - Enforce regulations in WUI areas
+                        ## Recommendations
+                        
+                        ### Immediate Actions (0-6 months)
                         """)
-                    else:
+                        
+                        if county_data.risk_category in ['Critical', 'High']:
+                            st.markdown("""
+                            1. **Emergency Mitigation Planning** - Initiate county-wide risk reduction strategies
+                            2. **Community Outreach** - Launch public education on fire preparedness
+                            3. **Evacuation Planning** - Update and test evacuation routes
+                            4. **Resource Staging** - Pre-position firefighting equipment
+                            5. **Defensible Space** - Enforce regulations in WUI areas
+                            """)
+                        else:
+                            st.markdown("""
+                            1. **Preventive Planning** - Maintain current mitigation efforts
+                            2. **Community Education** - Continue Firewise programs
+                            3. **Monitoring** - Track climate and fire indicators
+                            """)
+                        
                         st.markdown("""
-                        1. **Preventive Planning** - Maintain current mitigation efforts
-                        2. **Community Education** - Continue Firewise programs
-                        3. **Monitoring** - Track climate and fire indicators
+                        ### Strategic Planning (6-24 months)
+                        
+                        1. **Fuel Management** - Implement prescribed burns and mechanical thinning
+                        2. **Infrastructure Hardening** - Upgrade critical facilities
+                        3. **Zoning Updates** - Revise codes to reduce fire risk
+                        4. **Regional Coordination** - Establish mutual aid partnerships
+                        
+                        ---
                         """)
                     
-                    st.markdown("""
-                    ### Strategic Planning (6-24 months)
-                    
-                    1. **Fuel Management** - Implement prescribed burns and mechanical thinning
-                    2. **Infrastructure Hardening** - Upgrade critical facilities
-                    3. **Zoning Updates** - Revise codes to reduce fire risk
-                    4. **Regional Coordination** - Establish mutual aid partnerships
-                    
-                    ---
-                    
-                    ## Conclusion
-                    """)
+                    st.markdown("## Conclusion")
                     
                     risk_level_text = {
                         'Critical': 'immediate and comprehensive action',
@@ -328,9 +497,9 @@ elif report_type == "County Risk Assessment":
                     }
                     
                     st.markdown(f"""
-                    {county} County's {county_data['risk_category'].lower()} risk classification indicates the need for 
-                    {risk_level_text[county_data['risk_category']]}. With {county_data['population_at_risk']:,.0f} residents 
-                    in wildland-urban interface areas and a {county_data['climate_trend'].lower()} climate trend, the county 
+                    {county} County's {county_data.risk_category.lower()} risk classification indicates the need for 
+                    {risk_level_text[county_data.risk_category]}. With {county_data.population_at_risk:,.0f} residents 
+                    in wildland-urban interface areas and a {county_data.climate_trend.lower()} climate trend, the county 
                     faces significant wildfire challenges that require coordinated response from emergency management, 
                     fire services, and community stakeholders.
                     """)
@@ -339,37 +508,16 @@ elif report_type == "County Risk Assessment":
                     st.markdown("### Risk Profile")
                     
                     # Risk gauge
-                    fig_gauge = go.Figure(go.Indicator(
-                        mode="gauge+number",
-                        value=county_data['climate_fire_risk_score'],
-                        domain={'x': [0, 1], 'y': [0, 1]},
-                        gauge={
-                            'axis': {'range': [None, 100]},
-                            'bar': {'color': "darkred" if county_data['risk_category'] == 'Critical' else
-                                           "red" if county_data['risk_category'] == 'High' else
-                                           "orange" if county_data['risk_category'] == 'Moderate' else "green"},
-                            'steps': [
-                                {'range': [0, 45], 'color': "lightgray"},
-                                {'range': [45, 55], 'color': "lightyellow"},
-                                {'range': [55, 65], 'color': "lightcoral"},
-                                {'range': [65, 100], 'color': "lightpink"}
-                            ],
-                            'threshold': {
-                                'line': {'color': "black", 'width': 4},
-                                'thickness': 0.75,
-                                'value': county_data['climate_fire_risk_score']
-                            }
-                        }
-                    ))
-                    
-                    fig_gauge.update_layout(height=250)
-                    st.plotly_chart(fig_gauge, width="stretch")
+                    if include_charts:
+                        st.plotly_chart(
+                            gauge_chart_spec(
+                                float(county_data.climate_fire_risk_score), '',
+                                color=GAUGE_BAR_COLORS.get(county_data.risk_category, "green")
+                            ),
+                            width="stretch"
+                        )
                     
-                    st.markdown("### Component Scores")
-                    st.metric("Heat Stress", f"{county_data['heat_stress']:.1f}")
-                    st.metric("Drought Stress", f"{county_data['drought_stress']:.1f}")
-                    st.metric("Fire History", f"{county_data['fire_history_score']:.1f}")
-                    st.metric("WUI Exposure", f"{county_data['wui_exposure_score']:.1f}")
+                    st.markdown(COMPONENT_SCORES_TEMPLATE.format(county=county_data), unsafe_allow_html=True)
     else:
         st.warning("⚠️ Please select at least one county in the sidebar")
 
@@ -377,16 +525,9 @@ elif report_type == "Regional Analysis":
     st.header("🗺️ Regional Analysis Report")
     st.markdown("Comparative analysis across geographic regions")
     
-    # Define regions
-    eastern_counties = ['SPOKANE', 'YAKIMA', 'BENTON', 'FRANKLIN', 'WALLA WALLA', 
-                       'GRANT', 'CHELAN', 'DOUGLAS', 'OKANOGAN', 'ADAMS', 'WHITMAN']
-    
-    if region == "Eastern Washington":
-        region_df = df[df['County'].isin(eastern_counties)]
-        region_name = "Eastern Washington"
-    elif region == "Western Washington":
-        region_df = df[~df['County'].isin(eastern_counties)]
-        region_name = "Western Washington"
+    if region in ("Eastern Washington", "Western Washington"):
+        region_df = df.iloc[region_index()[region]]
+        region_name = region
     elif region == "Statewide":
         region_df = df
         region_name = "Statewide"
@@ -398,67 +539,17 @@ elif report_type == "Regional Analysis":
             region_df = df
             region_name = "Statewide"
     
+    # Statewide reuses the unfiltered views; other regions are cached per county set
+    region_key = None if region_df is df else tuple(region_df['County'])
+    
+    # Rebuilt only when the region, date or included sections change; other sidebar toggles reuse the stored text
+    md_key = (region_name, region_key, report_date, include_summary, include_recommendations)
+    if st.session_state.get('regional_md_key') != md_key:
+        st.session_state['regional_md'] = regional_report_md(*md_key)
+        st.session_state['regional_md_key'] = md_key
+    
     with st.expander("📊 Regional Report", expanded=True):
-        st.markdown(f"""
-        # {region_name} Wildfire Risk Analysis
-        
-        **Analysis Date:** {datetime.now().strftime('%B %d, %Y')}  
-        **Counties Included:** {len(region_df)}
-        
-        ---
-        
-        ## Regional Summary
-        
-        ### Risk Distribution
-        - **Critical Risk:** {len(region_df[region_df['risk_category'] == 'Critical'])} counties
-        - **High Risk:** {len(region_df[region_df['risk_category'] == 'High'])} counties
-        - **Moderate Risk:** {len(region_df[region_df['risk_category'] == 'Moderate'])} counties
-        - **Low Risk:** {len(region_df[region_df['risk_category'] == 'Low'])} counties
-        
-        ### Regional Averages
-        - **Average Risk Score:** {region_df['climate_fire_risk_score'].mean():.1f}
-        - **Total Population:** {region_df['population'].sum():,}
-        - **Population at Risk:** {region_df['population_at_risk'].sum():,.0f}
-        - **Average WUI Exposure:** {region_df['wui_exposure_pct'].mean():.1f}%
-        
-        ### Climate Trends
-        - **Warming & Drying:** {len(region_df[region_df['climate_trend'] == 'Warming & Drying'])} counties
-        - **Warming:** {len(region_df[region_df['climate_trend'] == 'Warming'])} counties
-        - **Stable:** {len(region_df[region_df['climate_trend'] == 'Stable'])} counties
-        
-        ---
-        
-        ## Highest Risk Counties
-        """)
-        
-        top_regional = region_df.nlargest(10, 'climate_fire_risk_score')
-        for idx, row in top_regional.iterrows():
-            st.markdown(f"""
-            ### {row['County']} County
-            - Risk Score: {row['climate_fire_risk_score']:.1f}
-            - Category: {row['risk_category']}
-            - Population at Risk: {row['population_at_risk']:,.0f}
-            - Climate Trend: {row['climate_trend']}
-            """)
-        
-        st.markdown("""
-        ---
-        
-        ## Regional Recommendations
-        
-        ### Priority Actions
-        1. Coordinate inter-county mutual aid agreements
-        2. Establish regional resource sharing protocols
-        3. Develop unified public education campaigns
-        4. Create regional evacuation coordination plans
-        5. Share best practices across jurisdictions
-        
-        ### Resource Allocation
-        - Focus on counties with Critical and High risk classifications
-        - Pre-position equipment in highest-risk areas
-        - Establish regional coordination centers
-        - Develop shared GIS and intelligence platforms
-        """)
+        st.markdown(st.session_state['regional_md'])
 
 else:  # Custom, Mitigation Planning, Historical Analysis
     st.header(f"📋 {report_type}")
@@ -485,10 +576,14 @@ with col2:
         else:
             export_df = df
         
+        # Serialized straight to bytes, only when the export is requested
+        buf = io.BytesIO()
+        export_df.to_csv(buf, index=False)
+        
         st.download_button(
             label="💾 Download Data",
-            data=export_df.to_csv(index=False),
-            file_name=f"wa_firewatch_{report_type.lower().replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.csv",
+            data=buf.getvalue(),
+            file_name=f"wa_firewatch_{report_type.lower().replace(' ', '_')}_{today.strftime('%Y%m%d')}.csv",
             mime="text/csv"
         )
 
@@ -0,0 +1,4 @@
+"""
+About Page Sections
+One module per About section, imported by the About page when first selected
+"""
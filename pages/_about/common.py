@@ -0,0 +1,52 @@
+"""
+About Page Shared Content
+Section icons and the cached markdown helpers used by every About section module
+"""
+
+import re
+
+import streamlit as st
+
+# Section and heading icons, kept in one place and interpolated into the labels
+ICONS = {
+    'overview': "🎯",
+    'sources': "📊",
+    'methodology': "🔬",
+    'guide': "📖",
+    'credits': "👥",
+    'pipeline': "📥",
+    'composite': "🔢",
+    'statistics': "📊",
+    'validation': "✅",
+    'home': "🏠",
+    'map': "🗺️",
+    'analytics': "📊",
+    'reports': "📄",
+    'tips': "💡",
+    'contact': "📧",
+    'acknowledgments': "🏆",
+    'citation': "📜",
+    'terms': "⚖️",
+    'changelog': "🔄"
+}
+
+# Cached once per distinct text (static documentation, so once per process);
+# cache_resource returns the stored tuple as-is instead of unpickling a copy per run
+@st.cache_resource(show_spinner=False)
+def markdown_blocks(text):
+    """Split markdown before each ### heading, so every section is its own element"""
+    return tuple(block for block in re.split(r'\n(?=[ \t]*### )', text) if block.strip())
+
+@st.cache_resource(show_spinner=False)
+def details_html(sections):
+    """One markdown string of <details> sections, written in a single element instead of an st.expander each"""
+    parts = []
+    for heading, summary, body, expanded in sections:
+        if heading:
+            parts.append(f"### {heading}")
+        parts.append(
+            f"<details{' open' if expanded else ''} style='border: 1px solid rgba(128, 128, 128, 0.3); "
+            f"border-radius: 0.5rem; padding: 0.5rem 1rem; margin-bottom: 1rem;'>\n"
+            f"<summary style='cursor: pointer;'>{summary}</summary>\n\n{body.strip()}\n\n</details>"
+        )
+    return '\n\n'.join(parts)
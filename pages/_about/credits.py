@@ -0,0 +1,216 @@
+"""
+About Page - Contact & Credits
+Contact details, acknowledgments, citation, terms and changelog
+"""
+
+import streamlit as st
+
+from pages._about.common import ICONS, details_html
+from utils.constants import PLATFORM_RELEASE, PLATFORM_VERSION
+
+CREDITS_CONTACT_MD = """
+**Platform Administrator**
+
+Josh Curry  
+Emergency Management Specialist  
+Washington State Emergency Management Division
+
+📧 **Email:** josh.curry@wa.gov  
+📞 **Phone:** (555) 123-4567  
+🌐 **Website:** wa.gov/firewatch
+
+---
+
+**Technical Support**
+
+For technical issues, data questions, or feature requests:
+
+📧 firewatch-support@wa.gov
+
+Response time: 1-2 business days
+
+---
+
+**Training & Workshops**
+
+Interested in WA FireWatch training for your organization?
+
+📧 firewatch-training@wa.gov
+
+We offer:
+- Virtual platform demonstrations
+- In-person workshops
+- Custom training sessions
+- User documentation
+"""
+
+CREDITS_ACKNOWLEDGMENTS_MD = """
+**Development Team**
+
+- **Josh Curry** - Platform Architecture & Development
+- **Washington State EMD** - Project Sponsorship
+- **Pierce College** - Initial Research Support
+
+---
+
+**Data Contributors**
+
+- NOAA National Centers for Environmental Information
+- Federal Emergency Management Agency (FEMA)
+- USDA Forest Service
+- U.S. Census Bureau
+- National Weather Service
+
+---
+
+**Technical Stack**
+
+Built with open-source technologies:
+- Python & Pandas
+- Streamlit
+- Plotly
+- Folium
+- NumPy & SciPy
+
+---
+
+**Special Thanks**
+
+- WA State Emergency Managers (feedback & testing)
+- WSEMA Certification Program participants
+- Academic reviewers & subject matter experts
+- Beta testers from local jurisdictions
+"""
+
+CREDITS_CITATION_MD = """
+Curry, J. (2025). Washington State Wildfire Risk Intelligence Platform. 
+Washington State Emergency Management Division. https://wa.gov/firewatch
+
+BibTeX:
+@software{curry2025firewatch,
+  author = {Curry, Josh},
+  title = {Washington State Wildfire Risk Intelligence Platform},
+  year = {2025},
+  publisher = {Washington State Emergency Management Division},
+  url = {https://wa.gov/firewatch}
+}
+"""
+
+CREDITS_TERMS_MD = """
+**Terms of Use**
+
+The Washington State Wildfire Risk Intelligence Platform is provided for emergency management planning and 
+research purposes. Users agree to:
+
+1. Use data responsibly and ethically
+2. Cite the Washington State Wildfire Risk Intelligence Platform in publications and presentations
+3. Not use platform for commercial purposes without permission
+4. Respect data source attributions
+5. Report errors or concerns to platform administrators
+
+**Disclaimer**
+
+⚠️ **Important Notice:**
+
+The Washington State Wildfire Risk Intelligence Platform provides risk assessment tools based on historical 
+data and statistical modeling. Users should be aware that:
+
+- Risk scores are estimates, not guarantees
+- Local conditions may vary significantly
+- Platform should inform, not replace, professional judgment
+- Real-time operational decisions require additional data
+- Climate projections involve inherent uncertainty
+
+**Liability**
+
+Washington State Emergency Management Division makes no warranties regarding:
+- Data accuracy or completeness
+- Suitability for specific purposes
+- Timeliness of updates
+- Availability or uptime
+
+Users assume all risk associated with platform use. Washington State is not liable 
+for decisions made based on WA FireWatch data or analysis.
+
+**Privacy**
+
+The Washington State Wildfire Risk Intelligence Platform:
+- Does not collect personal information
+- Uses anonymous usage analytics
+- Does not track individual users
+- Complies with state data policies
+
+**Copyright**
+
+© 2025 Washington State Emergency Management Division
+
+Platform code and original analysis: Licensed under MIT License  
+Data: Subject to original source licenses and terms
+
+**Questions?**
+
+Contact josh.curry@wa.gov for clarification on terms of use.
+"""
+
+# Changelog as one block per release, newest first; a new release prepends a block
+# and leaves the older ones untouched
+CHANGELOG_BLOCKS = (
+    (PLATFORM_VERSION, f"""
+**Version {PLATFORM_VERSION}** ({PLATFORM_RELEASE}) - Current
+- Complete platform redesign
+- Multi-page architecture
+- Advanced analytics suite
+- Report generation capabilities
+- Enhanced data integration
+- Improved user interface
+"""),
+    ("1.0", """
+**Version 1.0** (November 2024)
+- Initial release
+- Single-page dashboard
+- Basic risk mapping
+- FEMA disaster overlay
+- County statistics
+"""),
+    ("beta", """
+**Beta Testing** (October 2024)
+- Limited release to WA emergency managers
+- Feedback collection
+- Methodology validation
+""")
+)
+
+CREDITS_CHANGELOG_MD = '\n\n'.join(block.strip() for _, block in CHANGELOG_BLOCKS)
+
+# Collapsible groups as (heading, summary, body, expanded); heading None continues the previous one
+CREDITS_TERMS = ((f"{ICONS['terms']} Terms of Use & Disclaimer", "View Full Terms", CREDITS_TERMS_MD, False),)
+
+CREDITS_CHANGELOG = ((f"{ICONS['changelog']} Version History", "View Changelog", CREDITS_CHANGELOG_MD, False),)
+
+def render():
+    """Contact & Credits section"""
+    st.header("Contact & Credits")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader(f"{ICONS['contact']} Contact Information")
+        
+        st.markdown(CREDITS_CONTACT_MD)
+    
+    with col2:
+        st.subheader(f"{ICONS['acknowledgments']} Credits & Acknowledgments")
+        
+        st.markdown(CREDITS_ACKNOWLEDGMENTS_MD)
+    
+    st.markdown("---")
+    
+    st.subheader(f"{ICONS['citation']} Citation")
+    
+    st.code(CREDITS_CITATION_MD, language="text")
+    
+    # Terms and changelog with their dividers as one markdown element
+    st.markdown(
+        '\n\n---\n\n'.join(("", details_html(CREDITS_TERMS), details_html(CREDITS_CHANGELOG))),
+        unsafe_allow_html=True
+    )
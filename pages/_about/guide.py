@@ -0,0 +1,209 @@
+"""
+About Page - User Guide
+Getting started, per-page walkthroughs and tips
+"""
+
+import streamlit as st
+
+from pages._about.common import ICONS, details_html
+
+GUIDE_GETTING_STARTED_MD = """
+### Getting Started
+
+The Washington State Wildfire Risk Intelligence Platform is designed for intuitive use by emergency management 
+professionals, policymakers, and researchers. No GIS expertise required!
+"""
+
+GUIDE_HOME_MD = """
+The home dashboard provides executive-level overview:
+
+**Key Metrics**
+- Top banner shows critical statistics
+- Hover over metrics for definitions
+- Delta values show trends or comparisons
+
+**Top Risk Counties**
+- Table automatically sorted by risk score
+- Click column headers to re-sort
+- Color coding indicates risk category
+
+**Historical Trends**
+- Interactive timeline shows disaster frequency
+- Hover for year-specific data
+- Trend line projects future patterns
+
+**Action Items**
+- Recommended priorities based on current risk
+- Short-term (0-6 months) and strategic (6-24 months) actions
+"""
+
+GUIDE_MAP_MD = """
+**Sidebar Controls**
+- **Risk Filters:** Select categories, trends, score ranges, minimum population
+
+**Layer Controls (above the map)**
+1. **Map Style:** Choose map style (street, satellite, terrain)
+2. **Data Overlays:** Toggle FEMA markers, labels, heatmap
+3. **FEMA Options:** Year range, clustering, legend display
+
+**Map Interactions**
+- **Pan:** Click and drag to move around
+- **Zoom:** Scroll wheel or +/- buttons
+- **Click Markers:** View detailed county information
+- **Hover:** Quick preview of county name and score
+
+**Reading Markers**
+- 🔴 Red: Critical/High risk
+- 🟠 Orange: Moderate risk
+- 🟢 Green: Low risk
+- ⭕ Circles: FEMA disaster locations
+
+**Filtering Tips**
+- Start broad, then narrow down
+- Combine multiple filters for specific analysis
+- Use population slider to focus on high-impact areas
+- Compare different filter combinations
+"""
+
+GUIDE_ANALYTICS_MD = """
+**Analysis Types**
+
+1. **Correlation Analysis**
+   - Explore relationships between risk factors
+   - Identify which factors drive overall risk
+   - Use for understanding risk drivers
+
+2. **Time Series Trends**
+   - View historical disaster patterns
+   - Identify seasonal peaks
+   - See 5-year projections
+
+3. **Risk Factor Decomposition**
+   - Break down composite scores
+   - Compare component contributions
+   - Analyze individual county profiles
+
+4. **Predictive Modeling**
+   - Test climate change scenarios
+   - See projected risk changes
+   - Identify vulnerable counties
+
+5. **Comparative Analysis**
+   - Compare 2-5 counties side-by-side
+   - Use radar charts for visual comparison
+   - Benchmark against state averages
+
+6. **Statistical Summary**
+   - Review distribution statistics
+   - Check for statistical significance
+   - Validate assumptions
+
+**Tips for Analysis**
+- Save screenshots of key findings
+- Export data for offline analysis
+- Cross-reference multiple analysis types
+- Document assumptions and limitations
+"""
+
+GUIDE_REPORTS_MD = """
+**Report Types**
+
+1. **Executive Summary**
+   - High-level overview for leadership
+   - Key findings and recommendations
+   - 2-3 pages, suitable for briefings
+
+2. **County Risk Assessment**
+   - Detailed single-county analysis
+   - Comprehensive risk factors
+   - 5-10 pages with maps and charts
+
+3. **Regional Analysis**
+   - Multi-county comparison
+   - Eastern vs Western WA
+   - Custom region selection
+
+4. **Mitigation Planning**
+   - Action-oriented guidance
+   - Prioritized interventions
+   - Implementation timelines
+
+5. **Historical Analysis**
+   - Long-term trends
+   - Climate change impacts
+   - Predictive insights
+
+**Configuration Steps**
+1. Select report type in sidebar
+2. Choose scope (counties, regions)
+3. Select content sections to include
+4. Choose output format (PDF, Excel, HTML)
+5. Generate and download
+
+**Best Practices**
+- Review preview before generating
+- Include executive summary for all reports
+- Add charts for visual impact
+- Cite WA FireWatch in reports
+"""
+
+GUIDE_TIPS_MD = """
+**Workflow Recommendations**
+
+1. **Initial Assessment**
+   - Start with Home dashboard
+   - Identify high-risk counties
+   - Note concerning trends
+
+2. **Detailed Investigation**
+   - Use Interactive Map for geographic context
+   - Conduct Analytics for deeper understanding
+   - Generate Reports for documentation
+
+3. **Decision-Making**
+   - Compare multiple counties
+   - Test scenarios with predictive models
+   - Export data for stakeholder review
+
+**Common Use Cases**
+
+🔍 **Grant Applications**
+- Generate County Risk Assessment
+- Include statistical validation
+- Export supporting data
+
+📋 **Board Presentations**
+- Create Executive Summary
+- Take map screenshots
+- Highlight top priorities
+
+📊 **Strategic Planning**
+- Run predictive scenarios
+- Compare regional risks
+- Identify resource gaps
+
+👥 **Community Outreach**
+- Use map for visualizations
+- Generate simplified reports
+- Share exportable data
+"""
+
+# Collapsible groups as (heading, summary, body, expanded); heading None continues the previous one
+GUIDE_PAGES = (
+    (f"{ICONS['home']} Home Dashboard", "Navigate the Home Page", GUIDE_HOME_MD, False),
+    (f"{ICONS['map']} Interactive Map", "Using the Map Interface", GUIDE_MAP_MD, False),
+    (f"{ICONS['analytics']} Analytics", "Conducting Analysis", GUIDE_ANALYTICS_MD, False),
+    (f"{ICONS['reports']} Reports", "Generating Reports", GUIDE_REPORTS_MD, False)
+)
+
+def render():
+    """User Guide section"""
+    st.header("User Guide")
+    
+    st.markdown(GUIDE_GETTING_STARTED_MD)
+    
+    st.markdown(details_html(GUIDE_PAGES), unsafe_allow_html=True)
+    
+    st.subheader(f"{ICONS['tips']} Tips & Tricks")
+    
+    st.markdown(GUIDE_TIPS_MD)
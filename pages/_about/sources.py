@@ -0,0 +1,102 @@
+"""
+About Page - Data Sources
+Source metadata cards, processing pipeline and update schedule
+"""
+
+import json
+
+import streamlit as st
+
+from pages._about.common import ICONS, details_html
+from utils.constants import PLATFORM_VERSION
+
+# Per-source metadata (Source, Dataset, Variables, ...) behind the Data Sources cards
+DATA_SOURCES_JSON = 'data/data_sources.json'
+
+# One line per metadata field; list values become a bullet list under the label
+SOURCE_FIELD_TEMPLATE = "**{label}:** {value}"
+SOURCE_LIST_TEMPLATE = "**{label}:**\n{items}"
+
+SOURCES_INTRO_MD = """
+The Washington State Wildfire Risk Intelligence Platform integrates multiple authoritative data sources to provide comprehensive wildfire risk assessment:
+"""
+
+SOURCES_PIPELINE_MD = """
+### Integration Methodology
+
+1. **Data Acquisition**
+   - Automated downloads from source APIs
+   - Manual curation for quality assurance
+   - Version control and archiving
+
+2. **Geocoding & Standardization**
+   - County FIPS code matching
+   - Coordinate validation
+   - Date format standardization
+
+3. **Quality Control**
+   - Missing data identification
+   - Outlier detection and validation
+   - Cross-source verification
+
+4. **Aggregation & Calculation**
+   - County-level statistical aggregation
+   - Risk score computation
+   - Weighted composite scoring
+
+5. **Validation & Testing**
+   - Subject matter expert review
+   - Statistical validation
+   - User acceptance testing
+"""
+
+# Table columns, sent through st.dataframe rather than as markdown tables
+UPDATE_SCHEDULE = {
+    'Source': ['Climate Data', 'FEMA Disasters', 'NOAA Fire Events', 'WUI Data', 'Census Data'],
+    'Frequency': ['Annual', 'Real-time', 'Monthly', 'Decennial', 'Annual'],
+    'Last Update': ['Nov 2025', 'Nov 2025', 'Nov 2025', '2020', '2024']
+}
+
+SOURCES_QUALITY_MD = """
+### Data Quality Metrics
+
+- **Completeness:** 99.5% (all counties have complete data)
+- **Accuracy:** Verified against source documentation
+- **Timeliness:** Updated within 30 days of source updates
+- **Consistency:** Standardized formats and units
+"""
+
+@st.cache_resource(show_spinner=False)
+def data_source_cards(version):
+    """Data Sources cards as details_html sections, rendered from the JSON metadata once per release"""
+    with open(DATA_SOURCES_JSON, 'r', encoding='utf-8') as f:
+        sources = json.load(f)
+    
+    cards = []
+    for source in sources:
+        fields = [
+            SOURCE_LIST_TEMPLATE.format(label=label, items='\n'.join(f"- {item}" for item in value))
+            if isinstance(value, list) else
+            SOURCE_FIELD_TEMPLATE.format(label=label, value=value)
+            for label, value in source['fields'].items()
+        ]
+        cards.append((source['heading'], source['name'], '\n\n'.join(fields), True))
+    return tuple(cards)
+
+def render():
+    """Data Sources section"""
+    st.header("Data Sources & Integration")
+    
+    st.markdown(SOURCES_INTRO_MD)
+    
+    # Data source cards
+    st.markdown(details_html(data_source_cards(PLATFORM_VERSION)), unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    st.subheader(f"{ICONS['pipeline']} Data Processing Pipeline")
+    
+    st.markdown(SOURCES_PIPELINE_MD)
+    st.markdown("### Data Update Schedule")
+    st.dataframe(UPDATE_SCHEDULE, width="stretch", hide_index=True)
+    st.markdown(SOURCES_QUALITY_MD)
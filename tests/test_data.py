@@ -0,0 +1,65 @@
+"""
+Tests for the data loading utilities
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from utils.data import CLIMATE_TREND_DTYPE, RISK_CATEGORY_DTYPE, read_csv_cached
+
+SAMPLE_DTYPES = {'County': 'category', 'score': 'float32'}
+
+def write_sample_csv(tmp_path):
+    csv_path = tmp_path / 'sample.csv'
+    csv_path.write_text("County,score\nSPOKANE,61.5\nKING,40.0\n")
+    return csv_path
+
+def test_read_csv_cached_writes_sidecar(tmp_path):
+    csv_path = write_sample_csv(tmp_path)
+    df = read_csv_cached(csv_path, SAMPLE_DTYPES)
+
+    assert df['County'].tolist() == ['SPOKANE', 'KING']
+    assert csv_path.with_suffix('.parquet').exists()
+    # No temp files left next to the sidecar
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['sample.csv', 'sample.parquet']
+
+def test_read_csv_cached_recovers_from_truncated_sidecar(tmp_path):
+    csv_path = write_sample_csv(tmp_path)
+    parquet_path = csv_path.with_suffix('.parquet')
+    parquet_path.write_bytes(b'PAR1 truncated')
+    # Newer than the CSV, so the sidecar is tried first
+    csv_mtime = csv_path.stat().st_mtime
+    os.utime(parquet_path, (csv_mtime + 10, csv_mtime + 10))
+
+    df = read_csv_cached(csv_path, SAMPLE_DTYPES)
+
+    assert df['score'].tolist() == [61.5, 40.0]
+    pd.testing.assert_frame_equal(pd.read_parquet(parquet_path), df)
+
+def test_read_csv_cached_loads_every_known_trend(tmp_path):
+    csv_path = tmp_path / 'trends.csv'
+    csv_path.write_text("County,climate_trend\nSPOKANE,Warming\nKING,Cooling\n")
+
+    df = read_csv_cached(csv_path, {'County': 'category', 'climate_trend': CLIMATE_TREND_DTYPE})
+
+    assert df['climate_trend'].dtype == CLIMATE_TREND_DTYPE
+    assert df['climate_trend'].tolist() == ['Warming', 'Cooling']
+
+def test_read_csv_cached_rejects_unlisted_categories(tmp_path):
+    csv_path = tmp_path / 'trends.csv'
+    csv_path.write_text("County,climate_trend\nSPOKANE,Warming\nKING,Freezing\n")
+
+    with pytest.raises(ValueError, match='Freezing'):
+        read_csv_cached(csv_path, {'County': 'category', 'climate_trend': CLIMATE_TREND_DTYPE})
+    assert not csv_path.with_suffix('.parquet').exists()
+
+def test_read_csv_cached_applies_fixed_categories(tmp_path):
+    csv_path = tmp_path / 'risk.csv'
+    csv_path.write_text("County,risk_category\nSPOKANE,High\nKING,Low\n")
+
+    df = read_csv_cached(csv_path, {'County': 'category', 'risk_category': RISK_CATEGORY_DTYPE})
+
+    assert df['risk_category'].dtype == RISK_CATEGORY_DTYPE
+    assert df['risk_category'].tolist() == ['High', 'Low']
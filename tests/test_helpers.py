@@ -0,0 +1,112 @@
+"""
+Tests for the shared helper functions
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+from utils.helpers import (
+    build_percentile_lookup,
+    calculate_percentile_rank,
+    create_gauge_chart,
+    ensure_category_dtypes,
+    export_to_csv,
+    export_to_csv_iter,
+    filter_by_date_range,
+    gauge_chart_spec
+)
+
+def sample_export_frame():
+    return pd.DataFrame({
+        'County': ['SPOKANE', 'WALLA WALLA, WA'],
+        'score': [61.5, 2.0],
+        'population_at_risk': [1200.0, float('nan')],
+        'declarationDate': pd.to_datetime(['2023-08-19', '2021-07-01'], utc=True)
+    })
+
+def test_export_to_csv_bytes():
+    data, filename = export_to_csv(sample_export_frame(), 'wa_firewatch')
+
+    assert data == (
+        b"County,score,population_at_risk,declarationDate\n"
+        b"SPOKANE,61.5,1200.0,2023-08-19 00:00:00+00:00\n"
+        b"\"WALLA WALLA, WA\",2.0,,2021-07-01 00:00:00+00:00\n"
+    )
+    assert filename.startswith('wa_firewatch_') and filename.endswith('.csv')
+
+def test_export_to_csv_iter_joins_to_export_to_csv():
+    df = sample_export_frame()
+    data, _ = export_to_csv(df, 'wa_firewatch')
+
+    chunks = list(export_to_csv_iter(df, batch_rows=1))
+    assert len(chunks) == 2
+    assert b''.join(chunks) == data
+
+    empty_chunks = list(export_to_csv_iter(df.iloc[:0]))
+    assert empty_chunks == [export_to_csv(df.iloc[:0], 'wa_firewatch')[0]]
+
+def test_build_percentile_lookup_matches_calculate_percentile_rank():
+    scores = pd.Series(
+        [61.5, 40.0, 55.0, 40.0, np.nan, 72.25],
+        index=['FRANKLIN', 'KING', 'YAKIMA', 'PIERCE', 'ADAMS', 'CHELAN']
+    )
+    lookup = build_percentile_lookup(scores)
+
+    assert lookup['KING'] == 0
+    for county, score in scores.dropna().items():
+        assert lookup[county] == calculate_percentile_rank(score, scores)
+
+def test_calculate_percentile_rank_handles_datetimes_and_nan():
+    dates = pd.Series(pd.to_datetime(['2020-01-01', '2021-01-01', '2022-01-01', '2023-01-01', '2024-01-01']))
+    assert calculate_percentile_rank(pd.Timestamp('2021-06-01'), dates) == 40.0
+    assert calculate_percentile_rank(1.0, pd.Series([np.nan, 2.0, 3.0])) == 0.0
+
+def test_create_gauge_chart_returns_figure():
+    fig = create_gauge_chart(73.2, 'Risk Score', max_value=120, color='#123456')
+
+    assert isinstance(fig, go.Figure)
+    gauge = fig.data[0].gauge
+    assert fig.data[0].value == 73.2
+    assert gauge.axis.range == (None, 120)
+    assert gauge.bar.color == '#123456'
+    assert [step.range for step in gauge.steps][-1] == (120 * 0.65, 120)
+    assert fig.to_dict() == gauge_chart_spec(73.2, 'Risk Score', 120, '#123456')
+
+def sample_fema_frame():
+    return pd.DataFrame({
+        'declarationTitle': ['A FIRE', 'B FIRE', 'C FIRE', 'D FIRE', 'E FIRE'],
+        'declarationDate': pd.to_datetime(
+            ['2021-07-04', '2019-08-01', '2022-12-31', '2020-01-01', '2023-03-15'], utc=True
+        )
+    })
+
+def test_filter_by_date_range_string_bounds_on_unsorted_tz_aware_column():
+    fema = sample_fema_frame()
+    assert not fema['declarationDate'].is_monotonic_increasing
+
+    filtered = filter_by_date_range(fema, 'declarationDate', '2020-01-01', '2022-12-31')
+    assert filtered['declarationTitle'].tolist() == ['A FIRE', 'C FIRE', 'D FIRE']
+
+    # Same rows as the pandas comparison and as the sorted path
+    dates = fema['declarationDate']
+    expected = fema[(dates >= '2020-01-01') & (dates <= '2022-12-31')]
+    pd.testing.assert_frame_equal(filtered, expected)
+    sorted_fema = fema.sort_values('declarationDate')
+    sorted_filtered = filter_by_date_range(sorted_fema, 'declarationDate', '2020-01-01', '2022-12-31')
+    assert sorted(sorted_filtered['declarationTitle']) == sorted(filtered['declarationTitle'])
+
+def test_filter_by_date_range_naive_column():
+    fema = sample_fema_frame()
+    fema['declarationDate'] = fema['declarationDate'].dt.tz_localize(None)
+    fema.loc[1, 'declarationDate'] = pd.NaT
+
+    filtered = filter_by_date_range(fema, 'declarationDate', pd.Timestamp('2021-01-01'), '2023-12-31')
+    assert filtered['declarationTitle'].tolist() == ['A FIRE', 'C FIRE', 'E FIRE']
+
+def test_ensure_category_dtypes_rejects_unlisted_labels():
+    df = pd.DataFrame({'risk_category': ['High', 'Low'], 'climate_trend': ['Cooling', 'Freezing']})
+
+    with pytest.raises(ValueError, match='Freezing'):
+        ensure_category_dtypes(df)
@@ -0,0 +1,8 @@
+"""
+Platform Constants for WA FireWatch Platform
+Release metadata shared by the page footers and static documentation
+"""
+
+# Bump on each release; pages show it and the About page keys its cached content on it
+PLATFORM_VERSION = "2.0"
+PLATFORM_RELEASE = "November 2025"
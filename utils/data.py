@@ -0,0 +1,179 @@
+"""
+Data Loading Utilities for WA FireWatch Platform
+Cached loaders, column schemas and Parquet-backed CSV readers shared across pages
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+DASHBOARD_CSV = 'data/WA_Climate_Fire_Dashboard_Data.csv'
+FEMA_CSV = 'data/FEMA_Disasters_Geocoded.csv'
+COUNTIES_GEOJSON = 'data/wa_counties.geojson'
+
+# Risk classes from lowest to highest, so sorts and comparisons follow severity
+RISK_CATEGORY_DTYPE = pd.CategoricalDtype(['Low', 'Moderate', 'High', 'Critical'], ordered=True)
+
+# Every climate trend class the platform knows (the methodology's classes, the trend color
+# maps), whether or not the current data uses it; loading refuses labels not listed here
+# (see astype_categories), and charts drop the unused classes before plotting
+CLIMATE_TREND_DTYPE = pd.CategoricalDtype(['Cooling', 'Drying', 'Stable', 'Warming', 'Warming & Drying'])
+
+# Explicit column schemas so read_csv can skip type inference; every
+# dashboard measure is stored at 32 bits to halve its memory, and
+# labels as categoricals so equality, isin and groupby work on codes
+DASHBOARD_DTYPES = {
+    'County': 'category',
+    'county_fips': 'int64',
+    'population': 'int32',
+    'Fire_Count': 'int32',
+    'pct_intermix': 'float32',
+    'pct_interface': 'float32',
+    'wui_exposure_pct': 'float32',
+    'mean_pop_density': 'float32',
+    'avg_housing_density': 'float32',
+    'TMAX_Z_mean': 'float32',
+    'TMAX_Z_max': 'float32',
+    'PRCP_Z_mean': 'float32',
+    'PRCP_Z_min': 'float32',
+    'heat_stress': 'float32',
+    'drought_stress': 'float32',
+    'fire_history_score': 'float32',
+    'wui_exposure_score': 'float32',
+    'climate_fire_risk_score': 'float32',
+    'risk_category': RISK_CATEGORY_DTYPE,
+    'climate_trend': CLIMATE_TREND_DTYPE,
+    'population_at_risk': 'float32'
+}
+
+FEMA_DTYPES = {
+    'County': 'category',
+    'declarationTitle': 'str',
+    'disasterNumber': 'int64',
+    'fipsCountyCode': 'int64',
+    'lat': 'float64',
+    'lon': 'float64'
+}
+
+FEMA_DATE_COLUMNS = ['declarationDate']
+
+@dataclass(slots=True)
+class CountyRecord:
+    """One dashboard row as plain Python values, for per-county report text"""
+    County: str
+    county_fips: int
+    population: int
+    Fire_Count: int
+    pct_intermix: float
+    pct_interface: float
+    wui_exposure_pct: float
+    mean_pop_density: float
+    avg_housing_density: float
+    TMAX_Z_mean: float
+    TMAX_Z_max: float
+    PRCP_Z_mean: float
+    PRCP_Z_min: float
+    heat_stress: float
+    drought_stress: float
+    fire_history_score: float
+    wui_exposure_score: float
+    climate_fire_risk_score: float
+    risk_category: str
+    climate_trend: str
+    population_at_risk: float
+    interface_pct: float
+    intermix_pct: float
+
+def read_csv_cached(csv_path, dtype, parse_dates=None):
+    """Read a CSV through its Parquet sidecar, rewriting the sidecar when stale"""
+    csv_path = Path(csv_path)
+    parquet_path = csv_path.with_suffix('.parquet')
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        try:
+            df = pd.read_parquet(parquet_path, engine='pyarrow')
+        except (ImportError, OSError, ValueError):
+            pass  # No Parquet engine, or an unreadable sidecar (ArrowInvalid is a ValueError); rebuilt from the CSV
+        else:
+            # Sidecars written under an older schema are rebuilt from the CSV
+            if all(col in df and (kind == 'str' or df[col].dtype == kind) for col, kind in dtype.items()):
+                return df
+    
+    # Fixed category lists are applied after reading, so unknown labels raise instead of becoming NaN
+    declared = {col: kind for col, kind in dtype.items() if isinstance(kind, pd.CategoricalDtype)}
+    df = pd.read_csv(
+        csv_path,
+        usecols=list(dtype) + (parse_dates or []),
+        dtype={**dtype, **dict.fromkeys(declared, 'category')},
+        parse_dates=parse_dates
+    )
+    df = astype_categories(df, declared)
+    write_parquet_atomic(df, parquet_path)
+    return df
+
+def astype_categories(df, dtypes):
+    """Cast columns to fixed categorical dtypes, raising ValueError on labels a dtype does not list"""
+    for col, dtype in dtypes.items():
+        unknown = set(df[col].dropna().unique()) - set(dtype.categories)
+        if unknown:
+            raise ValueError(f"Column {col!r} has labels outside its categories: {sorted(unknown)}")
+    return df.astype(dtypes) if dtypes else df
+
+def write_parquet_atomic(df, parquet_path):
+    """Write a Parquet sidecar via a temp file in the same directory, so readers never see a partial file"""
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=parquet_path.parent, prefix=parquet_path.name, suffix='.tmp')
+    except OSError:
+        return  # data/ is read-only
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_path, engine='pyarrow', index=False)
+        os.replace(tmp_path, parquet_path)
+    except (ImportError, OSError):
+        pass  # Parquet engine unavailable or the write failed; the CSV stays the source
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+# Cached loaders (one shared instance per dataset for every page and session).
+# cache_resource hands out the same object without pickling a copy per call,
+# so callers must treat the frames as read-only and derive new frames instead.
+@st.cache_resource
+def load_data():
+    """Load the integrated dashboard dataset"""
+    df = read_csv_cached(DASHBOARD_CSV, DASHBOARD_DTYPES)
+    # Percent forms of the WUI housing shares, derived once for the popups and reports
+    df['interface_pct'] = (df['pct_interface'] * 100).astype('float32')
+    df['intermix_pct'] = (df['pct_intermix'] * 100).astype('float32')
+    return df
+
+@st.cache_resource
+def load_fema_data():
+    """Load FEMA disaster data"""
+    try:
+        fema = read_csv_cached(FEMA_CSV, FEMA_DTYPES, parse_dates=FEMA_DATE_COLUMNS)
+        # Calendar parts materialized once, as small integers, for the page aggregates
+        fema['year'] = fema['declarationDate'].dt.year.astype('int16')
+        fema['month'] = fema['declarationDate'].dt.month.astype('int8')
+        return fema
+    except FileNotFoundError:
+        return None
+
+@st.cache_data
+def load_geojson():
+    """Load Washington counties GeoJSON"""
+    try:
+        with open(COUNTIES_GEOJSON, 'r') as f:
+            geojson = json.load(f)
+        return geojson
+    except FileNotFoundError:
+        return None
+
+if __name__ == '__main__':
+    # Pre-build the Parquet sidecars (python -m utils.data), e.g. before deploying with a read-only data/
+    read_csv_cached(DASHBOARD_CSV, DASHBOARD_DTYPES)
+    read_csv_cached(FEMA_CSV, FEMA_DTYPES, parse_dates=FEMA_DATE_COLUMNS)
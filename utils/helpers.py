@@ -3,10 +3,37 @@ Utility Functions for WA FireWatch Platform
 Shared functions used across multiple pages
 """
 
+import copy
+import io
+from functools import cache, lru_cache
+from types import MappingProxyType
+
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import streamlit as st
 from datetime import datetime
 
+from utils.data import CLIMATE_TREND_DTYPE, RISK_CATEGORY_DTYPE, astype_categories
+
+# Score bins for Low/Moderate/High/Critical; each bin includes its lower edge
+RISK_SCORE_BINS = [-np.inf, 45, 55, 65, np.inf]
+
+# Label columns kept categorical, so equality, isin and value_counts work on codes
+CATEGORY_DTYPES = {
+    'risk_category': RISK_CATEGORY_DTYPE,
+    'climate_trend': CLIMATE_TREND_DTYPE
+}
+
+# All Eastern Washington counties, built once; a tuple keeps the order and indexing
+# of the old per-call list, and df['County'].isin() hashes it either way
+EASTERN_COUNTIES = (
+    'SPOKANE', 'YAKIMA', 'BENTON', 'FRANKLIN', 'WALLA WALLA',
+    'GRANT', 'CHELAN', 'DOUGLAS', 'OKANOGAN', 'ADAMS', 'WHITMAN',
+    'KITTITAS', 'KLICKITAT', 'COLUMBIA', 'GARFIELD', 'ASOTIN',
+    'FERRY', 'STEVENS', 'PEND OREILLE', 'LINCOLN'
+)
+
 def format_population(pop):
     """Format population numbers for display"""
     if pop >= 1000000:
@@ -16,26 +43,42 @@ def format_population(pop):
     else:
         return f"{pop:.0f}"
 
+def format_populations(pops):
+    """Format a whole Series of population numbers for display"""
+    values = pops.to_numpy(dtype=np.float64)
+    millions = values >= 1000000
+    thousands = (values >= 1000) & ~millions
+    rest = ~(millions | thousands)
+    # One comparison pass per magnitude, then each group formatted with its own spec
+    out = np.empty(values.shape, dtype=object)
+    out[millions] = [f"{x:.2f}M" for x in values[millions] / 1000000]
+    out[thousands] = [f"{x:.1f}K" for x in values[thousands] / 1000]
+    out[rest] = [f"{x:.0f}" for x in values[rest]]
+    return pd.Series(out, index=pops.index, name=pops.name)
+
 def get_risk_color(risk_category):
     """Return color code for risk category"""
-    color_map = {
-        'Critical': '#8B0000',
-        'High': '#FF4500',
-        'Moderate': '#FFA500',
-        'Low': '#90EE90'
-    }
-    return color_map.get(risk_category, '#CCCCCC')
+    return RISK_COLORS.get(risk_category, DEFAULT_COLOR)
 
 def get_trend_color(climate_trend):
     """Return color code for climate trend"""
-    color_map = {
-        'Warming & Drying': '#d32f2f',
-        'Warming': '#f57c00',
-        'Stable': '#7cb342',
-        'Cooling': '#1976d2'
-    }
-    return color_map.get(climate_trend, '#CCCCCC')
+    return TREND_COLORS.get(climate_trend, DEFAULT_COLOR)
+
+def map_risk_colors(risk_categories):
+    """Return color codes for a whole Series of risk categories"""
+    if risk_categories.dtype == RISK_CATEGORY_DTYPE:
+        # Category codes index straight into the color table; missing (-1) picks the trailing default
+        colors = RISK_COLORS_BY_CODE[risk_categories.cat.codes.to_numpy()]
+        return pd.Series(colors, index=risk_categories.index, name=risk_categories.name, dtype=object)
+    # Other categorical input maps only its categories; object keeps the fill color assignable
+    return risk_categories.map(RISK_COLORS).astype(object).fillna(DEFAULT_COLOR)
 
+def map_trend_colors(climate_trends):
+    """Return color codes for a whole Series of climate trends"""
+    return climate_trends.map(TREND_COLORS).astype(object).fillna(DEFAULT_COLOR)
+
+# Scalar call sites repeat a handful of scores; NaN keys never hit but still return Low
+@lru_cache(maxsize=1024)
 def calculate_risk_category(score):
     """Determine risk category from score"""
     if score >= 65:
@@ -47,58 +90,125 @@ def calculate_risk_category(score):
     else:
         return 'Low'
 
-def create_gauge_chart(value, title, max_value=100, color='#d32f2f'):
-    """Create a gauge chart for risk visualization"""
+def calculate_risk_categories(scores):
+    """Determine risk categories for a whole score Series in one pass"""
+    categories = pd.cut(scores, bins=RISK_SCORE_BINS, labels=list(RISK_CATEGORY_DTYPE.categories), right=False)
+    return categories.astype(RISK_CATEGORY_DTYPE)
+
+# Gauge step bands as fractions of the gauge maximum, with their colors
+GAUGE_STEP_BOUNDS = (0, 0.45, 0.55, 0.65, 1)
+GAUGE_STEP_COLORS = ("lightgray", "lightyellow", "lightcoral", "lightpink")
+
+@cache
+def _gauge_template():
+    """Figure dict of a 0-100 gauge, built and validated by plotly once per process"""
     fig = go.Figure(go.Indicator(
         mode="gauge+number",
-        value=value,
+        value=0,
         domain={'x': [0, 1], 'y': [0, 1]},
-        title={'text': title},
+        title={'text': ''},
         gauge={
-            'axis': {'range': [None, max_value]},
-            'bar': {'color': color},
+            'axis': {'range': [None, 100]},
+            'bar': {'color': '#d32f2f'},
             'steps': [
-                {'range': [0, max_value * 0.45], 'color': "lightgray"},
-                {'range': [max_value * 0.45, max_value * 0.55], 'color': "lightyellow"},
-                {'range': [max_value * 0.55, max_value * 0.65], 'color': "lightcoral"},
-                {'range': [max_value * 0.65, max_value], 'color': "lightpink"}
+                {'range': [low * 100, high * 100], 'color': step_color}
+                for low, high, step_color in zip(GAUGE_STEP_BOUNDS, GAUGE_STEP_BOUNDS[1:], GAUGE_STEP_COLORS)
             ],
             'threshold': {
                 'line': {'color': "black", 'width': 4},
                 'thickness': 0.75,
-                'value': value
+                'value': 0
             }
         }
     ))
     
     fig.update_layout(height=250, margin=dict(l=20, r=20, t=50, b=20))
+    return fig.to_dict()
+
+def create_gauge_chart(value, title, max_value=100, color='#d32f2f'):
+    """Create a gauge chart for risk visualization"""
+    return go.Figure(gauge_chart_spec(value, title, max_value, color))
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def gauge_chart_spec(value, title, max_value=100, color='#d32f2f'):
+    """Gauge chart as a plain figure dict, cached; st.plotly_chart renders it without a go.Figure"""
+    # Only the scalars differ between gauges, so patch a copy of the template instead of
+    # rebuilding and revalidating the figure
+    fig = copy.deepcopy(_gauge_template())
+    gauge_trace = fig['data'][0]
+    gauge_trace['value'] = value
+    gauge_trace['title']['text'] = title
+    gauge = gauge_trace['gauge']
+    gauge['axis']['range'][1] = max_value
+    gauge['bar']['color'] = color
+    gauge['threshold']['value'] = value
+    for step, low, high in zip(gauge['steps'], GAUGE_STEP_BOUNDS, GAUGE_STEP_BOUNDS[1:]):
+        step['range'] = [max_value * low, max_value * high]
     return fig
 
 def filter_by_date_range(df, date_column, start_date, end_date):
     """Filter dataframe by date range"""
-    mask = (df[date_column] >= start_date) & (df[date_column] <= end_date)
+    dates = df[date_column]
+    is_datetime = pd.api.types.is_datetime64_any_dtype(dates)
+    if is_datetime:
+        # Bounds as Timestamps in the column's timezone, so both paths below accept the same input
+        tz = getattr(dates.dtype, 'tz', None)
+        start_date, end_date = _date_bound(start_date, tz), _date_bound(end_date, tz)
+    if dates.is_monotonic_increasing:
+        # Sorted dates: binary-search both ends and slice, no boolean mask
+        start = dates.searchsorted(start_date, side='left')
+        end = dates.searchsorted(end_date, side='right')
+        return df.iloc[start:end]
+    if is_datetime:
+        # Compare the raw datetime64 values (UTC for tz-aware columns); NaT never matches
+        values = dates.values
+        mask = (values >= start_date.to_datetime64()) & (values <= end_date.to_datetime64())
+    else:
+        mask = (dates >= start_date) & (dates <= end_date)
     return df[mask]
 
+def _date_bound(bound, tz):
+    """A date range bound as a Timestamp; naive bounds are taken in the column's timezone"""
+    bound = pd.Timestamp(bound)
+    if bound.tz is None and tz is not None:
+        return bound.tz_localize(tz)
+    if bound.tz is not None and tz is None:
+        raise TypeError("Cannot compare tz-naive and tz-aware datetime-like objects")
+    return bound
+
 def export_to_csv(df, filename_prefix):
-    """Prepare dataframe for CSV export with timestamp"""
+    """Prepare dataframe for CSV export with timestamp, as UTF-8 bytes for st.download_button"""
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     filename = f"{filename_prefix}_{timestamp}.csv"
-    return df.to_csv(index=False), filename
+    # Encoded straight into a bytes buffer instead of building the whole CSV as a str first;
+    # pandas' writer keeps the export format (minimal quoting, '2.0' floats, '+00:00' offsets)
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, encoding='utf-8')
+    return buf.getvalue(), filename
+
+def export_to_csv_iter(df, batch_rows=10000):
+    """Yield a dataframe's CSV as UTF-8 byte chunks of batch_rows rows, header first, for large tables"""
+    # Only one slice is formatted and held at a time, instead of the whole CSV; an empty
+    # frame still yields its header row
+    for start in range(0, max(len(df), 1), batch_rows):
+        buf = io.BytesIO()
+        df.iloc[start:start + batch_rows].to_csv(buf, index=False, header=start == 0, encoding='utf-8')
+        yield buf.getvalue()
 
 def calculate_percentile_rank(value, series):
     """Calculate percentile rank of a value within a series"""
-    return (series < value).sum() / len(series) * 100
+    # Share of entries strictly below the value, in one vectorized comparison pass
+    return (series < value).mean() * 100
+
+def build_percentile_lookup(series):
+    """Percentile rank (0-100) of every entry, keyed by the series index (e.g. County)"""
+    # One sort for the whole column instead of a scan per calculate_percentile_rank call;
+    # the minimum rank counts the entries strictly below, as calculate_percentile_rank does
+    return (series.rank(method='min') - 1) / len(series) * 100
 
 def get_eastern_western_counties():
-    """Return lists of counties by region"""
-    eastern_counties = [
-        'SPOKANE', 'YAKIMA', 'BENTON', 'FRANKLIN', 'WALLA WALLA',
-        'GRANT', 'CHELAN', 'DOUGLAS', 'OKANOGAN', 'ADAMS', 'WHITMAN',
-        'KITTITAS', 'KLICKITAT', 'COLUMBIA', 'GARFIELD', 'ASOTIN',
-        'FERRY', 'STEVENS', 'PEND OREILLE', 'LINCOLN'
-    ]
-    
-    return eastern_counties
+    """Return the Eastern Washington counties in a fixed order; every other county is Western"""
+    return EASTERN_COUNTIES
 
 def format_date_for_display(date_obj):
     """Format datetime for display"""
@@ -106,22 +216,35 @@ def format_date_for_display(date_obj):
         return "N/A"
     return date_obj.strftime('%B %d, %Y')
 
+def format_dates_for_display(dates):
+    """Format a whole Series of datetimes for display, with missing dates as N/A"""
+    return dates.dt.strftime('%B %d, %Y').where(dates.notna(), "N/A")
+
+def ensure_category_dtypes(df):
+    """Return df with risk_category and climate_trend as their shared categorical dtypes, or raise ValueError on unknown labels"""
+    # Frames from load_data already match and come back as is; others are converted once
+    to_convert = {
+        col: dtype for col, dtype in CATEGORY_DTYPES.items()
+        if col in df.columns and df[col].dtype != dtype
+    }
+    return astype_categories(df, to_convert)
+
 def create_risk_summary_dict(df):
     """Create summary statistics dictionary"""
+    df = ensure_category_dtypes(df)
+    risk_counts = df['risk_category'].value_counts()
     return {
         'total_counties': len(df),
-        'critical_counties': len(df[df['risk_category'] == 'Critical']),
-        'high_counties': len(df[df['risk_category'] == 'High']),
+        'critical_counties': int(risk_counts.get('Critical', 0)),
+        'high_counties': int(risk_counts.get('High', 0)),
         'avg_risk_score': df['climate_fire_risk_score'].mean(),
         'total_population': df['population'].sum(),
         'population_at_risk': df['population_at_risk'].sum(),
-        'warming_counties': len(df[df['climate_trend'].str.contains('Warming', na=False)])
+        'warming_counties': int(df['climate_trend'].isin(WARMING_TRENDS).sum())
     }
 
-# Custom CSS styling
-def get_custom_css():
-    """Return custom CSS for consistent styling"""
-    return """
+# Custom CSS styling, built once at import
+CUSTOM_CSS = """
     <style>
     .metric-card {
         background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
@@ -179,25 +302,40 @@ def get_custom_css():
     </style>
     """
 
-# Color schemes for consistent visualization
-RISK_COLORS = {
+def get_custom_css():
+    """Return custom CSS for consistent styling"""
+    return CUSTOM_CSS
+
+# Color schemes for consistent visualization, read-only so they can be shared without copies
+DEFAULT_COLOR = '#CCCCCC'
+
+RISK_COLORS = MappingProxyType({
     'Critical': '#8B0000',
     'High': '#FF4500',
     'Moderate': '#FFA500',
     'Low': '#90EE90'
-}
+})
 
-TREND_COLORS = {
+# RISK_COLORS in RISK_CATEGORY_DTYPE code order, then the default for missing values
+RISK_COLORS_BY_CODE = np.array(
+    [RISK_COLORS[category] for category in RISK_CATEGORY_DTYPE.categories] + [DEFAULT_COLOR],
+    dtype=object
+)
+
+# Climate trends that count as warming in summaries
+WARMING_TRENDS = ('Warming', 'Warming & Drying')
+
+TREND_COLORS = MappingProxyType({
     'Warming & Drying': '#d32f2f',
     'Warming': '#f57c00',
     'Stable': '#7cb342',
     'Cooling': '#1976d2'
-}
+})
 
-BRAND_COLORS = {
+BRAND_COLORS = MappingProxyType({
     'primary': '#d32f2f',
     'secondary': '#1976d2',
     'success': '#388e3c',
     'warning': '#f57c00',
     'info': '#0288d1'
-}
+})